@@ -0,0 +1,26 @@
+"""Shared, process-cached Google Cloud clients.
+
+``trend_scout`` and ``creative_agent`` each carried their own cached
+``_get_gcs_client`` / ``_get_bigquery_client``. Building a client resolves ADC
+and opens a fresh auth/HTTP session, so the factories live here, cached per
+project: every tool call and callback in a process (including both packages
+when they share one, e.g. ``adk web`` or ``interactive_creative``) reuses one
+client and its connection pool. Each package keeps a thin ``_get_*_client``
+wrapper that supplies its own ``config`` project.
+"""
+
+import functools
+
+from google.cloud import bigquery, storage
+
+
+@functools.cache
+def get_gcs_client(project: str) -> storage.Client:
+    """Get the process-wide GCS client for ``project`` (built lazily on first use)."""
+    return storage.Client(project=project)
+
+
+@functools.cache
+def get_bigquery_client(project: str) -> bigquery.Client:
+    """Get the process-wide BigQuery client for ``project`` (built lazily on first use)."""
+    return bigquery.Client(project=project)
@@ -4,10 +4,23 @@ Extracted verbatim from the per-agent ``callbacks.py`` modules — ``trend_scout
 and ``creative_agent`` carried byte-identical copies. The callback closes over an
 agent's ``config`` so each package keeps its own ``rpm_quota`` /
 ``rate_limit_seconds`` values while sharing one implementation.
+
+The limiter's bookkeeping is process-local (a sliding window of request start
+times held by the closure), NOT session state: writing ``timer_start`` /
+``request_count`` into ``callback_context.state`` on every LLM call emitted a
+state delta that ADK persisted alongside the (large) trend/research state.
+
+The callback is a coroutine: ADK awaits async model callbacks, so a throttled
+request waits with ``asyncio.sleep`` and the event loop keeps running sibling
+tool calls and sub-agents instead of stalling behind a blocking ``time.sleep``.
 """
 
 import time
+import asyncio
 import logging
+import threading
+from collections import deque
+from collections.abc import Callable
 
 from google.adk.models.llm_request import LlmRequest
 from google.adk.agents.callback_context import CallbackContext
@@ -15,19 +28,33 @@ from google.adk.agents.callback_context import CallbackContext
 from agent_common.config import BaseAgentConfiguration
 
 
-def build_rate_limit_callback(config: BaseAgentConfiguration):
+def build_rate_limit_callback(
+    config: BaseAgentConfiguration, clock: Callable[[], float] = time.monotonic
+):
     """Build a ``before_model_callback`` that enforces a requests-per-minute quota.
 
+    At most ``rpm_quota`` requests start in any ``rate_limit_seconds`` window.
+    The window is shared by every agent wired with the returned callback in this
+    process (Vertex quota is project-wide, not per-session).
+
     Args:
         config: The agent configuration supplying ``rpm_quota`` and
             ``rate_limit_seconds``.
+        clock: Monotonic clock returning seconds; injectable so tests can drive
+            the window without patching the process-wide ``time.monotonic``.
 
     Returns:
-        A ``(callback_context, llm_request) -> None`` callback suitable for
+        An async ``(callback_context, llm_request) -> None`` callback suitable for
         wiring as an agent's ``before_model_callback``.
     """
+    window = config.rate_limit_seconds
+    # Start times (per ``clock``) of the requests in the current window, oldest
+    # first. A request that must wait reserves its future start slot here before
+    # sleeping, so concurrent callers never claim the same slot.
+    starts: deque[float] = deque()
+    lock = threading.Lock()
 
-    def rate_limit_callback(
+    async def rate_limit_callback(
         callback_context: CallbackContext, llm_request: LlmRequest
     ) -> None:
         # pylint: disable=unused-argument
@@ -38,35 +65,22 @@ def build_rate_limit_callback(config: BaseAgentConfiguration):
                   callback context.
           llm_request: A LlmRequest object representing the active LLM request.
         """
-        now = time.time()
-        if "timer_start" not in callback_context.state:
-            callback_context.state["timer_start"] = now
-            callback_context.state["request_count"] = 1
-            logging.debug(
-                "rate_limit_callback [timestamp: %i, req_count: 1, elapsed_secs: 0]",
-                now,
-            )
-            return
+        with lock:
+            now = clock()
+            while starts and starts[0] <= now - window:
+                starts.popleft()
+            start = now
+            if len(starts) >= config.rpm_quota:
+                start = max(now, starts[-config.rpm_quota] + window)
+            starts.append(start)
+            in_window = len(starts)
 
-        request_count = callback_context.state["request_count"] + 1
-        elapsed_secs = now - callback_context.state["timer_start"]
+        delay = start - now
         logging.debug(
-            "rate_limit_callback [timestamp: %i, request_count: %i, elapsed_secs: %i]",
-            now,
-            request_count,
-            elapsed_secs,
+            "rate_limit_callback [in_window: %i, delay_secs: %.1f]", in_window, delay
         )
-
-        if request_count > config.rpm_quota:
-            delay = config.rate_limit_seconds - elapsed_secs + 1
-            if delay > 0:
-                logging.debug("Sleeping for %i seconds", delay)
-                time.sleep(delay)
-            callback_context.state["timer_start"] = now
-            callback_context.state["request_count"] = 1
-        else:
-            callback_context.state["request_count"] = request_count
-
-        return
+        if delay > 0:
+            logging.debug("Sleeping for %.1f seconds", delay)
+            await asyncio.sleep(delay)
 
     return rate_limit_callback
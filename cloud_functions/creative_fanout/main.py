@@ -96,13 +96,39 @@ def _get_vertex_client():
     return _vertex_client
 
 
+# resource name -> (vertex client that resolved it, AgentEngine handle)
+_remote_agents: dict = {}
+
+
+def _get_remote_agent(agent_id: str):
+    """Get the AgentEngine handle for `agent_id`, reusing it across invocations.
+
+    A warm worker instance serves many Pub/Sub messages for the same engine, and
+    `agent_engines.get` is a full HTTP round-trip to the `reasoningEngines`
+    endpoint. Caching the handle keeps every stream/delete on the one shared
+    Vertex client (and its pooled, kept-alive connections) instead of
+    re-resolving the engine per message. The entry is only reused while it was
+    resolved by the current client.
+    """
+    client = _get_vertex_client()
+    name = (
+        f"projects/{_PROJECT_NUMBER}/locations/{_LOCATION}/reasoningEngines/{agent_id}"
+    )
+    cached = _remote_agents.get(name)
+    if cached is not None and cached[0] is client:
+        return cached[1]
+    remote_agent = client.agent_engines.get(name=name)
+    _remote_agents[name] = (client, remote_agent)
+    return remote_agent
+
+
 # ==============================
 # helper functions
 # ==============================
 def pretty_print_event(event):
     """Pretty prints an event with truncation for long content."""
     if "content" not in event:
-        logging.info(f"[{event.get('author', 'unknown')}]: {event}")
+        logging.info("[%s]: %s", event.get("author", "unknown"), event)
         return
 
     author = event.get("author", "unknown")
@@ -110,28 +136,29 @@ def pretty_print_event(event):
 
     for part in parts:
         if "text" in part:
-            text = part["text"]
-            logging.info(f"[{author}]: {text}")
+            logging.info("[%s]: %s", author, part["text"])
         elif "functionCall" in part:
             func_call = part["functionCall"]
             logging.info(
-                f"[{author}]: Function call: {func_call.get('name', 'unknown')}"
+                "[%s]: Function call: %s", author, func_call.get("name", "unknown")
             )
             # Truncate args if too long
             args = json.dumps(func_call.get("args", {}))
             if len(args) > 100:
                 args = args[:97] + "..."
-            logging.info(f"  Args: {args}")
+            logging.info("  Args: %s", args)
         elif "functionResponse" in part:
             func_response = part["functionResponse"]
             logging.info(
-                f"[{author}]: Function response: {func_response.get('name', 'unknown')}"
+                "[%s]: Function response: %s",
+                author,
+                func_response.get("name", "unknown"),
             )
             # Truncate response if too long
             response = json.dumps(func_response.get("response", {}))
             if len(response) > 100:
                 response = response[:97] + "..."
-            logging.info(f"  Response: {response}")
+            logging.info("  Response: %s", response)
 
 
 def update_rows_status(bq_client, dataset, table, timestamps, status="PROCESSED"):
@@ -207,9 +234,7 @@ async def create_agent_run(
     """
     logging.info(f"Invoking Agent Run {msg_dict['index'] + 1}...")
 
-    remote_agent = _get_vertex_client().agent_engines.get(
-        name=f"projects/{_PROJECT_NUMBER}/locations/{_LOCATION}/reasoningEngines/{agent_id}"
-    )
+    remote_agent = _get_remote_agent(agent_id)
 
     USER_QUERY = f"""Brand: {msg_dict["brand"]}
     Target Product: {msg_dict["target_product"]}
@@ -555,7 +580,9 @@ def crf_entrypoint(cloud_event: CloudEvent) -> None:
 
             data_str = json.dumps(worker_payload)
             data_bytes = data_str.encode("utf-8")
-            publish_futures.append(pubsub_publisher.publish(_WORKER_TOPIC_NAME, data_bytes))
+            publish_futures.append(
+                pubsub_publisher.publish(_WORKER_TOPIC_NAME, data_bytes)
+            )
 
         dispatched_count = 0
         failed_count = 0
@@ -8,12 +8,14 @@ from zoneinfo import ZoneInfo
 from google.cloud import bigquery
 from google.adk.tools import ToolContext
 
+from agent_common import get_bigquery_client
+
 from .config import config
 
 
 def _get_bigquery_client() -> bigquery.Client:
-    """Get a configured BigQuery client."""
-    return bigquery.Client(project=config.BQ_PROJECT_ID)
+    """Get the configured BigQuery client (process-cached, see agent_common.clients)."""
+    return get_bigquery_client(config.BQ_PROJECT_ID)
 
 
 def build_eval_bq_row(
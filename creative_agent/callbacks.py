@@ -1,8 +1,8 @@
 import uuid
 import warnings
-import pandas as pd
 import re
 import logging
+import datetime
 from typing import Optional, Dict, Any
 
 from google.genai import types
@@ -47,7 +47,7 @@ def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
         target: The session state object to insert into.
     """
     unique_id = f"{str(uuid.uuid4())[:4]}"
-    formatted_now = pd.Timestamp.now("UTC").strftime("%Y_%m_%d_%H_%M")
+    formatted_now = datetime.datetime.now(datetime.UTC).strftime("%Y_%m_%d_%H_%M")
     if config.state_init not in target:
         target[config.state_init] = True
         target["gcs_bucket"] = config.GCS_BUCKET
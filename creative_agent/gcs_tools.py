@@ -1,12 +1,12 @@
 """Cloud Storage tools: uploads/downloads, PDF + eval-report persistence, hi-res."""
 
+import io
 import os
 import json
 import string
 import asyncio
 import tempfile
 import logging
-import functools
 
 from PIL import Image
 from markdown_pdf import MarkdownPdf, Section
@@ -15,6 +15,8 @@ from google.genai import types
 from google.cloud import storage
 from google.adk.tools import ToolContext
 
+from agent_common import get_gcs_client
+
 from .config import config
 
 
@@ -33,10 +35,9 @@ def artifact_key_for(concept_name: str) -> str:
     return concept_name.translate(REMOVE_PUNCTUATION).replace(" ", "_") + ".png"
 
 
-@functools.cache
 def _get_gcs_client() -> storage.Client:
-    """Get a configured GCS client (cached; built lazily on first use)."""
-    return storage.Client(project=config.PROJECT_ID)
+    """Get the configured GCS client (process-cached, see agent_common.clients)."""
+    return get_gcs_client(config.PROJECT_ID)
 
 
 def _download_blob(bucket_name, source_blob_name):
@@ -79,7 +80,7 @@ def _save_to_gcs(
 
     except Exception as e_gcs:
         # Propagate so ADK 2.0 RetryConfig can retry transient infra failures.
-        logging.error(f"GCS upload failed for '{filename}': {e_gcs}")
+        logging.error("GCS upload failed for '%s': %s", filename, e_gcs)
         raise
 
 
@@ -106,6 +107,28 @@ def _upload_blob_to_gcs(
     return f"File {source_file_name} uploaded to {destination_blob_name}."
 
 
+def _upload_string_to_gcs(
+    data: str | bytes,
+    destination_blob_name: str,
+    content_type: str,
+) -> str:
+    """
+    Uploads in-memory content to a GCS bucket (no local scratch file).
+    Args:
+        data (str | bytes): The content to upload (str is sent as UTF-8).
+        destination_blob_name (str): The desired folder path in gcs
+            e.g., "folder/paths-to/storage-object-name"
+        content_type (str): The object's content type, e.g. "text/html".
+    Returns:
+        str: A confirmation message naming the uploaded object.
+    """
+    storage_client = _get_gcs_client()
+    bucket = storage_client.bucket(config.GCS_BUCKET_NAME)
+    blob = bucket.blob(destination_blob_name)
+    blob.upload_from_string(data, content_type=content_type)
+    return f"Content uploaded to {destination_blob_name}."
+
+
 def _get_high_res_img(gcs_folder: str, gcs_subdir: str, artifact_key: str):
     """
     gets existing img artifact, increases size, and  uploads to Cloud Storage
@@ -123,47 +146,30 @@ def _get_high_res_img(gcs_folder: str, gcs_subdir: str, artifact_key: str):
     storage_client = _get_gcs_client()
     bucket = storage_client.bucket(config.GCS_BUCKET_NAME)
     blob = bucket.blob(f"{gcs_folder}/{gcs_subdir}/{artifact_key}")
-    # Per-invocation temp dir: concurrent runs share this process's CWD, so bare
-    # scratch names collided (issue #104) when two runs resized a like-named
-    # concept — one run's cleanup raced the other's download/resize. A
-    # TemporaryDirectory is unique per call and auto-removed on context exit.
-    local_name = f"local_{artifact_key}"
-    xl_name = f"XL_{local_name}"
-    img = None
-
-    with tempfile.TemporaryDirectory() as td:
-        local_path = os.path.join(td, local_name)
-        xl_path = os.path.join(td, xl_name)
-        try:
-            with open(local_path, "wb") as file_obj:
-                # Download the blob contents to the opened file object
-                blob.download_to_file(file_obj)
-
-            # convert to higher res
-            img = Image.open(local_path)
-            current_w, current_h = img.size
-            new_w = int(current_w * 1.5)
-            new_h = int(current_h * 1.5)
-            resized_image = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            resized_image.save(xl_path)
-
-            # upload to gcs — the object name is the file BASENAME, not the temp
-            # path, so the scratch dir never leaks into the GCS object key.
-            mTLS_GCS_PREFIX = "https://storage.mtls.cloud.google.com"
-            NEW_BLOB_NAME = f"{gcs_folder}/{gcs_subdir}/resized/{xl_name}"
-            new_blob = bucket.blob(NEW_BLOB_NAME)
-            new_blob.upload_from_filename(xl_path)
-
-            high_res_auth_gcs_uri = (
-                f"{mTLS_GCS_PREFIX}/{config.GCS_BUCKET_NAME}/{NEW_BLOB_NAME}?authuser=3"
-            )
-            return high_res_auth_gcs_uri
 
-        finally:
-            # Release the PIL handle even on a mid-function raise; the enclosing
-            # TemporaryDirectory removes both scratch files on context exit.
-            if img is not None:
-                img.close()
+    # Download, resize and re-encode entirely in memory: no scratch files to
+    # write, re-read through buffered file objects, and clean up, and so nothing
+    # for concurrent runs sharing this process's CWD to collide on (issue #104).
+    # Artifact keys are always `<name>.png` (artifact_key_for), so the resized
+    # image is encoded as PNG explicitly rather than inferred from a filename.
+    with Image.open(io.BytesIO(blob.download_as_bytes())) as img:
+        current_w, current_h = img.size
+        new_w = int(current_w * 1.5)
+        new_h = int(current_h * 1.5)
+        resized_image = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    png_buffer = io.BytesIO()
+    resized_image.save(png_buffer, format="PNG")
+
+    # upload to gcs (object name unchanged from the old scratch-file naming)
+    mTLS_GCS_PREFIX = "https://storage.mtls.cloud.google.com"
+    NEW_BLOB_NAME = f"{gcs_folder}/{gcs_subdir}/resized/XL_local_{artifact_key}"
+    new_blob = bucket.blob(NEW_BLOB_NAME)
+    new_blob.upload_from_string(png_buffer.getvalue(), content_type="image/png")
+
+    high_res_auth_gcs_uri = (
+        f"{mTLS_GCS_PREFIX}/{config.GCS_BUCKET_NAME}/{NEW_BLOB_NAME}?authuser=3"
+    )
+    return high_res_auth_gcs_uri
 
 
 async def save_draft_report_artifact(tool_context: ToolContext) -> dict:
@@ -222,7 +228,10 @@ async def save_draft_report_artifact(tool_context: ToolContext) -> dict:
             gcs_uri = f"gs://{gcs_bucket}/{gcs_blob_name}"
             tool_context.state["research_report_gcs_uri"] = gcs_uri
             logging.info(
-                f"\n\nSaved artifact doc '{artifact_key}', version {version}, to: '{gcs_uri}' \n\n"
+                "\n\nSaved artifact doc '%s', version %s, to: '%s' \n\n",
+                artifact_key,
+                version,
+                gcs_uri,
             )
 
             return {
@@ -232,7 +241,7 @@ async def save_draft_report_artifact(tool_context: ToolContext) -> dict:
 
     except Exception as e:
         # Propagate so ADK 2.0 RetryConfig can retry transient infra failures.
-        logging.exception(f"Error saving artifact: {e}")
+        logging.exception("Error saving artifact: %s", e)
         raise
 
 
@@ -268,11 +277,11 @@ def save_eval_report_to_gcs(tool_context: ToolContext) -> dict:
         blob.upload_from_string(report_json, content_type="application/json")
 
         tool_context.state["eval_report_gcs_uri"] = gcs_uri
-        logging.info(f"Saved creative eval report to: '{gcs_uri}'")
+        logging.info("Saved creative eval report to: '%s'", gcs_uri)
 
         return {"status": "success", "gcs_uri": gcs_uri}
 
     except Exception as e:
         # Propagate so ADK 2.0 RetryConfig can retry transient infra failures.
-        logging.exception(f"Error saving eval report to GCS: {e}")
+        logging.exception("Error saving eval report to GCS: %s", e)
         raise
@@ -1,7 +1,5 @@
-import os
 import asyncio
 import logging
-import tempfile
 import warnings
 
 from google.adk.tools import ToolContext
@@ -12,7 +10,7 @@ from . import gallery_template as gt
 
 # Backward-compatible re-exports: keep the public ``creative_agent.tools`` import
 # surface unchanged after the implementation moved into sibling modules. Some of
-# these (``_get_high_res_img``, ``_upload_blob_to_gcs``) are also used by
+# these (``_get_high_res_img``, ``_upload_string_to_gcs``) are also used by
 # ``save_creative_gallery_html`` below.
 from .image_tools import (  # noqa: F401
     generate_image,
@@ -36,6 +34,7 @@ from .gcs_tools import (  # noqa: F401
     _download_blob,
     _save_to_gcs,
     _upload_blob_to_gcs,
+    _upload_string_to_gcs,
     _get_high_res_img,
 )
 
@@ -59,8 +58,7 @@ def memorize(key: str, value: str, tool_context: ToolContext):
     Returns:
         A status message.
     """
-    mem_dict = tool_context.state
-    mem_dict[key] = value
+    tool_context.state[key] = value
     return {"status": f'Stored "{key}": "{value}"'}
 
 
@@ -157,7 +155,9 @@ async def save_creative_gallery_html(tool_context: ToolContext) -> dict:
                 )
             except Exception as e:
                 logging.warning(
-                    f"Could not create high-res image for '{ARTIFACT_KEY}', falling back to standard-res: {e}"
+                    "Could not create high-res image for '%s', falling back to standard-res: %s",
+                    ARTIFACT_KEY,
+                    e,
                 )
                 HIGH_RES_AUTH_GCS_URL = AUTH_GCS_URL
 
@@ -243,26 +243,21 @@ async def save_creative_gallery_html(tool_context: ToolContext) -> dict:
             + gt.HTML_END_JAVASCRIPT
         )
 
-        # Save the HTML to a temp file then upload (blocking file + network I/O —
-        # off the loop). A per-invocation temp dir keeps concurrent runs from racing
-        # on a shared CWD filename (issue #104): the bare 'creative_portfolio_...html'
-        # let one run's os.remove delete the file another run was still uploading.
-        # TemporaryDirectory is unique per call and auto-cleaned on context exit.
+        # Upload the HTML straight from memory (blocking network I/O — off the
+        # loop). No scratch file means no temp dir to create and sweep per call,
+        # and nothing for concurrent runs sharing this process's CWD to race on
+        # (issue #104: a bare 'creative_portfolio_...html' scratch file let one
+        # run's cleanup delete the file another run was still uploading).
         REPORT_NAME = "creative_portfolio_gallery.html"
         gcs_blob_name = f"{gcs_folder}/{gcs_subdir}/{REPORT_NAME}"
         gcs_uri = f"gs://{config.GCS_BUCKET_NAME}/{gcs_blob_name}"
 
-        def _write_and_upload() -> None:
-            with tempfile.TemporaryDirectory() as td:
-                path = os.path.join(td, REPORT_NAME)
-                with open(path, "w", encoding="utf-8") as html_file:
-                    html_file.write(FINAL_HTML)
-                _upload_blob_to_gcs(
-                    source_file_name=path,
-                    destination_blob_name=gcs_blob_name,
-                )
-
-        await asyncio.to_thread(_write_and_upload)
+        await asyncio.to_thread(
+            _upload_string_to_gcs,
+            FINAL_HTML,
+            destination_blob_name=gcs_blob_name,
+            content_type="text/html",
+        )
 
         return {
             "status": "success",
@@ -271,5 +266,5 @@ async def save_creative_gallery_html(tool_context: ToolContext) -> dict:
 
     except Exception as e:
         # Propagate so ADK 2.0 RetryConfig can retry transient infra failures.
-        logging.exception(f"Error saving artifact: {e}")
+        logging.exception("Error saving artifact: %s", e)
         raise
@@ -7,6 +7,7 @@ import dotenv
 import asyncio
 import logging
 import warnings
+import string
 import argparse
 from contextlib import asynccontextmanager
 
@@ -27,18 +28,44 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 warnings.filterwarnings("ignore")
+logger = logging.getLogger(__name__)
 
 # load .env file
 ENV_FILE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env"))
 dotenv.load_dotenv(dotenv_path=ENV_FILE_PATH)
 
 
-TEST_QUERY = f"""Brand: {os.getenv("BRAND")}
-Target Product: {os.getenv("TARGET_PRODUCT")}
-Key Selling Point(s): {os.getenv("KEY_SELLING_POINT")}
-Target Audience: {os.getenv("TARGET_AUDIENCE")}
-Target Search Trend: {os.getenv("TARGET_SEARCH_TREND")}
+# Campaign-metadata env vars the test message is built from. All are required:
+# an unset var would otherwise be rendered as a literal "None" and shipped to
+# the model.
+REQUIRED_QUERY_ENV = (
+    "BRAND",
+    "TARGET_PRODUCT",
+    "KEY_SELLING_POINT",
+    "TARGET_AUDIENCE",
+    "TARGET_SEARCH_TREND",
+)
+
+TEST_QUERY_TEMPLATE = string.Template(
+    """Brand: $BRAND
+Target Product: $TARGET_PRODUCT
+Key Selling Point(s): $KEY_SELLING_POINT
+Target Audience: $TARGET_AUDIENCE
+Target Search Trend: $TARGET_SEARCH_TREND
 """
+)
+
+
+def _missing_query_env() -> list[str]:
+    """Return the required campaign-metadata env vars that are unset or empty."""
+    return [k for k in REQUIRED_QUERY_ENV if not os.environ.get(k)]
+
+
+def _prepare_query() -> str:
+    """Build the campaign-metadata test message from the .env values."""
+    return TEST_QUERY_TEMPLATE.substitute(
+        {k: os.environ[k] for k in REQUIRED_QUERY_ENV}
+    )
 
 
 parser = argparse.ArgumentParser(
@@ -72,7 +99,7 @@ client = vertexai.Client(
 def pretty_print_event(event):
     """Pretty prints an event with truncation for long content."""
     if "content" not in event:
-        logging.info(f"[{event.get('author', 'unknown')}]: {event}")
+        logger.info("[%s]: %s", event.get("author", "unknown"), event)
         return
 
     author = event.get("author", "unknown")
@@ -80,32 +107,33 @@ def pretty_print_event(event):
 
     for part in parts:
         if "text" in part:
-            text = part["text"]
-            logging.info(f"[{author}]: {text}")
+            logger.info("[%s]: %s", author, part["text"])
         elif "functionCall" in part:
             func_call = part["functionCall"]
-            logging.info(
-                f"[{author}]: Function call: {func_call.get('name', 'unknown')}"
+            logger.info(
+                "[%s]: Function call: %s", author, func_call.get("name", "unknown")
             )
             # Truncate args if too long
             args = json.dumps(func_call.get("args", {}))
             if len(args) > 100:
                 args = args[:97] + "..."
-            logging.info(f"  Args: {args}")
+            logger.info("  Args: %s", args)
         elif "functionResponse" in part:
             func_response = part["functionResponse"]
-            logging.info(
-                f"[{author}]: Function response: {func_response.get('name', 'unknown')}"
+            logger.info(
+                "[%s]: Function response: %s",
+                author,
+                func_response.get("name", "unknown"),
             )
             # Truncate response if too long
             response = json.dumps(func_response.get("response", {}))
             if len(response) > 100:
                 response = response[:97] + "..."
-            logging.info(f"  Response: {response}")
+            logger.info("  Response: %s", response)
 
 
 # function to interact with remote agent
-async def async_send_message(remote_agent, user_id, session) -> None:
+async def async_send_message(remote_agent, user_id, session, user_query) -> None:
     """Send a message to the deployed agent."""
 
     # Clear events for each new query
@@ -115,13 +143,13 @@ async def async_send_message(remote_agent, user_id, session) -> None:
         async for event in remote_agent.async_stream_query(
             user_id=user_id,
             session_id=session["id"],
-            message=TEST_QUERY,  # user_input
+            message=user_query,  # user_input
         ):
             events.append(event)
             pretty_print_event(event)
 
     except Exception as e:
-        logging.error(f"Error during streaming: {type(e).__name__}: {e}")
+        logger.error("Error during streaming: %s: %s", type(e).__name__, e)
         # Propagate so a broken deployment surfaces as a failure, mirroring the
         # worker path (cloud_functions/creative_fanout/main.py).
         raise
@@ -137,39 +165,51 @@ async def agent_session(remote_agent, user_id):
     `FAILED_PRECONDITION: Session <id> does not belong to user <...>`.
     """
     session = await remote_agent.async_create_session(user_id=user_id)
-    logging.info(f"Created session {session['id']} for user ID: {user_id}")
+    logger.info("Created session %s for user ID: %s", session["id"], user_id)
     try:
         yield session
     finally:
         await remote_agent.async_delete_session(
             user_id=user_id, session_id=session["id"]
         )
-        logging.info(f"Deleted session {session['id']} for user ID: {user_id}")
+        logger.info("Deleted session %s for user ID: %s", session["id"], user_id)
 
 
 async def main() -> None:  # pylint: disable=unused-argument
     """Main function that uses the defined flags."""
 
     # get instance of agent
-    logging.info("\n\nGetting Agent Engine Runtime...\n\n")
+    logger.info("\n\nGetting Agent Engine Runtime...\n\n")
     if not args.agent:
-        logging.error("Error: --agent is required for the create operation.")
+        logger.error("Error: --agent is required for the create operation.")
+        return
+    missing = _missing_query_env()
+    if missing:
+        logger.error("Error: set %s in .env", ", ".join(missing))
         return
     if args.agent == "trend_scout":
-        remote_agent = client.agent_engines.get(name=os.getenv("SCOUT_AGENT_ENGINE_ID"))
+        engine_id = os.getenv("SCOUT_AGENT_ENGINE_ID")
     elif args.agent == "creative_agent":
-        remote_agent = client.agent_engines.get(
-            name=os.getenv("CREATIVE_AGENT_ENGINE_ID")
-        )
-    logging.info(f"\n\nremote_agent: {remote_agent}")
+        engine_id = os.getenv("CREATIVE_AGENT_ENGINE_ID")
+    else:
+        logger.error("Error: unsupported --agent %r.", args.agent)
+        return
+
+    user_query = _prepare_query()
+    # Resolving the engine is a blocking HTTP GET — run it off the event loop.
+    remote_agent = await asyncio.to_thread(client.agent_engines.get, name=engine_id)
+    logger.info("\n\nremote_agent: %s", remote_agent)
 
     # get session — create → stream → delete under one user_id (delete-on-error).
-    logging.info(f"\n\nCreating session for user ID: {args.user_id}...\n\n")
+    logger.info("\n\nCreating session for user ID: %s...\n\n", args.user_id)
     async with agent_session(remote_agent, args.user_id) as session:
-        logging.info(session)
+        logger.info("%s", session)
         # long running op
         await async_send_message(
-            remote_agent=remote_agent, user_id=args.user_id, session=session
+            remote_agent=remote_agent,
+            user_id=args.user_id,
+            session=session,
+            user_query=user_query,
         )
 
 
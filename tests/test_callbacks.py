@@ -1,7 +1,6 @@
 """Tests for callback functions (citation replacement, state init, rate limiting)."""
 
 import re
-import time
 import types as pytypes
 
 
@@ -122,6 +121,48 @@ class TestSetInitialStates:
         assert target["agent_output_dir"] == "trawler_output"
         assert target["brand"] == "PRS"
 
+    def test_trend_scout_gcs_folder_is_utc_timestamp_plus_id(self):
+        from trend_scout.callbacks import _set_initial_states
+
+        target = {}
+        _set_initial_states({}, target)
+
+        # stdlib datetime (not pandas) must keep the same YYYY_MM_DD_HH_MM_<id> shape
+        assert re.fullmatch(
+            r"\d{4}_\d{2}_\d{2}_\d{2}_\d{2}_[0-9a-f]{4}", target["gcs_folder"]
+        )
+
+    def test_creative_gcs_folder_is_utc_timestamp_plus_id(self):
+        from creative_agent.callbacks import _set_initial_states
+
+        target = {}
+        _set_initial_states({}, target)
+
+        assert re.fullmatch(
+            r"\d{4}_\d{2}_\d{2}_\d{2}_\d{2}_[0-9a-f]{4}", target["gcs_folder"]
+        )
+
+    def test_trend_scout_sessions_do_not_share_initial_state(self):
+        """The default state is built once at import; each session must get its
+        own copy so one run's saved trends never leak into the next session."""
+        from trend_scout.callbacks import load_session_state
+
+        def _ctx():
+            return pytypes.SimpleNamespace(
+                agent_name="trend_scout",
+                invocation_id="inv",
+                session=pytypes.SimpleNamespace(id="s"),
+                user_id="u",
+                state={},
+            )
+
+        first, second = _ctx(), _ctx()
+        load_session_state(first)
+        first.state["target_search_trends"]["target_search_trends"].append("t1")
+        load_session_state(second)
+
+        assert second.state["target_search_trends"] == {"target_search_trends": []}
+
     # --- Optional visual-intent keys (image-intent-capture) ---
     _INTENT_KEYS = (
         "visual_intent",
@@ -171,53 +212,81 @@ class TestSetInitialStates:
 
 
 # --- Rate limit callback ---
-class TestRateLimitLogic:
-    """Tests the rate limiting logic without importing CallbackContext."""
-
-    def test_first_call_initializes_state(self):
-        """First call should set timer_start and request_count=1."""
-        state = {}
-        now = time.time()
-
-        # Simulate first call logic
-        if "timer_start" not in state:
-            state["timer_start"] = now
-            state["request_count"] = 1
-
-        assert state["request_count"] == 1
-        assert state["timer_start"] == now
-
-    def test_subsequent_calls_increment_count(self):
-        state = {"timer_start": time.time(), "request_count": 5}
-        state["request_count"] = state["request_count"] + 1
-        assert state["request_count"] == 6
-
-    def test_quota_exceeded_resets_count(self):
-        rpm_quota = 10
-        now = time.time()
-        state = {
-            "timer_start": now - 30,  # 30 seconds ago
-            "request_count": rpm_quota,
-        }
-
-        request_count = state["request_count"] + 1
-        if request_count > rpm_quota:
-            state["timer_start"] = now
-            state["request_count"] = 1
+class TestRateLimitCallback:
+    """The shared limiter keeps a process-local sliding window: it never touches
+    session state, and the (rpm_quota + 1)-th request in a window waits."""
 
-        assert state["request_count"] == 1
-
-    def test_under_quota_keeps_counting(self):
-        rpm_quota = 1000
-        state = {"timer_start": time.time(), "request_count": 50}
-
-        request_count = state["request_count"] + 1
-        if request_count > rpm_quota:
-            state["request_count"] = 1
-        else:
-            state["request_count"] = request_count
-
-        assert state["request_count"] == 51
+    @staticmethod
+    def _callback(rpm_quota, monkeypatch, clock):
+        import asyncio
+
+        from agent_common import rate_limit
+
+        async def fake_sleep(delay):
+            clock.append(delay)
+
+        monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+        cfg = pytypes.SimpleNamespace(rpm_quota=rpm_quota, rate_limit_seconds=60)
+        # Inject the fake clock; patching time.monotonic would also move the
+        # clock asyncio.run's event loop schedules with.
+        cb = rate_limit.build_rate_limit_callback(cfg, clock=lambda: clock[0])
+        return lambda ctx, req: asyncio.run(cb(ctx, req))
+
+    def test_leaves_session_state_untouched(self, monkeypatch):
+        clock = [100.0]
+        cb = self._callback(10, monkeypatch, clock)
+        ctx = pytypes.SimpleNamespace(state={})
+        cb(ctx, None)
+        cb(ctx, None)
+        assert ctx.state == {}
+
+    def test_under_quota_never_sleeps(self, monkeypatch):
+        clock = [100.0]
+        cb = self._callback(3, monkeypatch, clock)
+        for _ in range(3):
+            cb(pytypes.SimpleNamespace(state={}), None)
+        assert clock == [100.0]  # no sleep recorded
+
+    def test_over_quota_sleeps_until_oldest_leaves_window(self, monkeypatch):
+        clock = [100.0]
+        cb = self._callback(2, monkeypatch, clock)
+        cb(pytypes.SimpleNamespace(state={}), None)
+        clock[0] = 110.0
+        cb(pytypes.SimpleNamespace(state={}), None)
+        clock[0] = 120.0
+        cb(pytypes.SimpleNamespace(state={}), None)
+        # oldest request started at 100 -> the third may start at 160
+        assert clock[1:] == [40.0]
+
+    def test_throttled_request_does_not_block_the_event_loop(self):
+        """While one request waits for a slot, other coroutines keep running."""
+        import asyncio
+
+        from agent_common import rate_limit
+
+        cfg = pytypes.SimpleNamespace(rpm_quota=1, rate_limit_seconds=0.2)
+        cb = rate_limit.build_rate_limit_callback(cfg)
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.02)
+
+        async def main():
+            await cb(pytypes.SimpleNamespace(state={}), None)
+            await asyncio.gather(cb(pytypes.SimpleNamespace(state={}), None), ticker())
+
+        asyncio.run(main())
+        assert len(ticks) == 3
+
+    def test_window_slides(self, monkeypatch):
+        clock = [100.0]
+        cb = self._callback(1, monkeypatch, clock)
+        cb(pytypes.SimpleNamespace(state={}), None)
+        clock[0] = 161.0
+        cb(pytypes.SimpleNamespace(state={}), None)
+        assert clock == [161.0]
 
 
 # --- Force-image-tool-call callback (issue #116) ---
@@ -261,3 +330,153 @@ class TestForceImageToolCall:
         assert result is None
         # Already succeeded → must NOT re-force the tool (idempotent re-run).
         assert req.config.tool_config is None
+
+
+# --- understand_trends research cache ---
+class TestResearchCache:
+    """The searcher's raw findings are cached per (model, term list, UTC day): a
+    hit answers the first model call, a miss stores the final text turn."""
+
+    class _FakeBlob:
+        def __init__(self, store, name, custom_times):
+            self._store, self._name = store, name
+            self._custom_times = custom_times
+
+        # No exists(): a read is one download, and a missing object raises
+        # NotFound like the real client.
+        def download_as_text(self):
+            from google.api_core import exceptions as api_exceptions
+
+            if self._name not in self._store:
+                raise api_exceptions.NotFound(self._name)
+            return self._store[self._name]
+
+        def upload_from_string(self, data, content_type=None):
+            self._store[self._name] = data
+            self._custom_times[self._name] = getattr(self, "custom_time", None)
+
+    def _fake_gcs(self, store, custom_times=None):
+        custom_times = {} if custom_times is None else custom_times
+        bucket = pytypes.SimpleNamespace(
+            blob=lambda n: self._FakeBlob(store, n, custom_times)
+        )
+        return pytypes.SimpleNamespace(bucket=lambda _: bucket)
+
+    @staticmethod
+    def _ctx(state):
+        return pytypes.SimpleNamespace(state=state)
+
+    def test_key_ignores_term_order_and_case(self):
+        from trend_scout.callbacks import _research_cache_blob_name
+
+        a = _research_cache_blob_name({"raw_gtrends": ["Golden Dip", "aurora"]})
+        b = _research_cache_blob_name({"raw_gtrends": [" aurora", "golden dip"]})
+        assert a == b
+        assert a.startswith("cache/understand/")
+
+    def test_human_picked_terms_key_differently(self):
+        from trend_scout.callbacks import _research_cache_blob_name
+
+        raw = {"raw_gtrends": ["golden dip", "aurora"]}
+        picked = dict(raw, target_search_trends={"target_search_trends": ["aurora"]})
+        assert _research_cache_blob_name(raw) != _research_cache_blob_name(picked)
+
+    def test_no_terms_means_no_cache(self):
+        from trend_scout.callbacks import _research_cache_blob_name
+
+        assert _research_cache_blob_name({}) is None
+
+    def test_miss_then_store_then_hit(self, monkeypatch):
+        import asyncio
+
+        from google.adk.models.llm_request import LlmRequest
+        from google.adk.models.llm_response import LlmResponse
+        from google.genai import types
+
+        from trend_scout import callbacks
+
+        store, custom_times = {}, {}
+        monkeypatch.setattr(
+            callbacks, "_get_gcs_client", lambda: self._fake_gcs(store, custom_times)
+        )
+        ctx = self._ctx({"raw_gtrends": ["golden dip"]})
+
+        assert asyncio.run(callbacks.load_cached_research(ctx, LlmRequest())) is None
+
+        findings = LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text="facts")]),
+            finish_reason=types.FinishReason.STOP,
+        )
+        asyncio.run(callbacks.store_cached_research(ctx, findings))
+        assert list(store.values()) == ["facts"]
+        # custom_time drives the bucket's daysSinceCustomTime expiry rule
+        assert custom_times.keys() == store.keys()
+        assert all(t is not None for t in custom_times.values())
+
+        hit = asyncio.run(callbacks.load_cached_research(ctx, LlmRequest()))
+        assert hit.content.parts[0].text == "facts"
+
+    def test_empty_turn_is_not_cached(self, monkeypatch):
+        import asyncio
+
+        from google.adk.models.llm_response import LlmResponse
+
+        from trend_scout import callbacks
+
+        store = {}
+        monkeypatch.setattr(callbacks, "_get_gcs_client", lambda: self._fake_gcs(store))
+        ctx = self._ctx({"raw_gtrends": ["golden dip"]})
+
+        asyncio.run(callbacks.store_cached_research(ctx, LlmResponse()))
+        assert store == {}
+
+    def test_read_errors_fall_through_to_the_live_model(self, monkeypatch):
+        import asyncio
+
+        from google.adk.models.llm_request import LlmRequest
+        from google.api_core import exceptions as api_exceptions
+
+        from trend_scout import callbacks
+
+        def broken_gcs():
+            raise api_exceptions.ServiceUnavailable("gcs down")
+
+        monkeypatch.setattr(callbacks, "_get_gcs_client", broken_gcs)
+        ctx = self._ctx({"raw_gtrends": ["golden dip"]})
+        assert asyncio.run(callbacks.load_cached_research(ctx, LlmRequest())) is None
+
+    def test_lifecycle_rule_expires_the_cache_prefix(self):
+        import json
+        import pathlib
+
+        from trend_scout.callbacks import RESEARCH_CACHE_PREFIX
+
+        path = pathlib.Path(__file__).parents[1] / "deployment/gcs_lifecycle.json"
+        (rule,) = json.loads(path.read_text())["rule"]
+        assert rule["action"]["type"] == "Delete"
+        assert rule["condition"]["daysSinceCustomTime"] == 1
+        assert rule["condition"]["matchesPrefix"] == [f"{RESEARCH_CACHE_PREFIX}/"]
+
+    def test_truncated_or_blocked_turn_is_not_cached(self, monkeypatch):
+        import asyncio
+
+        from google.adk.models.llm_response import LlmResponse
+        from google.genai import types
+
+        from trend_scout import callbacks
+
+        store = {}
+        monkeypatch.setattr(callbacks, "_get_gcs_client", lambda: self._fake_gcs(store))
+        ctx = self._ctx({"raw_gtrends": ["golden dip"]})
+
+        for reason in (
+            types.FinishReason.MAX_TOKENS,
+            types.FinishReason.SAFETY,
+            types.FinishReason.RECITATION,
+        ):
+            partial_findings = LlmResponse(
+                content=types.Content(role="model", parts=[types.Part(text="fac")]),
+                finish_reason=reason,
+            )
+            asyncio.run(callbacks.store_cached_research(ctx, partial_findings))
+        assert store == {}
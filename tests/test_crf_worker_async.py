@@ -227,3 +227,22 @@ def test_create_agent_run_deletes_session_on_stream_error(monkeypatch):
         )
 
     assert deleted == {"user_id": user_id, "session_id": "sess-stream"}
+
+
+def test_remote_agent_handle_is_reused_across_runs(monkeypatch):
+    """A warm worker resolves each engine once: repeat runs reuse the cached
+    AgentEngine handle (no per-message `agent_engines.get` round-trip), while a
+    new Vertex client re-resolves rather than serving a stale handle."""
+    monkeypatch.setattr(main, "_remote_agents", {})
+    fake_vertex = MagicMock()
+    monkeypatch.setattr(main, "_get_vertex_client", lambda: fake_vertex)
+
+    first = main._get_remote_agent("agent-123")
+    second = main._get_remote_agent("agent-123")
+    assert first is second
+    assert fake_vertex.agent_engines.get.call_count == 1
+
+    other_vertex = MagicMock()
+    monkeypatch.setattr(main, "_get_vertex_client", lambda: other_vertex)
+    main._get_remote_agent("agent-123")
+    assert other_vertex.agent_engines.get.call_count == 1
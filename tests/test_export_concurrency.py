@@ -98,18 +98,19 @@ def test_save_draft_report_artifact_isolates_concurrent_runs(monkeypatch, tmp_pa
 
 
 def test_save_creative_gallery_html_isolates_concurrent_runs(monkeypatch, tmp_path):
-    """Two concurrent gallery exports must use DISTINCT scratch paths and leave no
-    bare ``creative_portfolio_gallery.html`` in the CWD."""
+    """Two concurrent gallery exports must upload to DISTINCT per-run objects and
+    stage nothing on local disk (the HTML is uploaded from memory)."""
     monkeypatch.chdir(tmp_path)
 
     recorded: list[str] = []
 
-    def _fake_upload(source_file_name, destination_blob_name):
-        assert os.path.exists(source_file_name), source_file_name
-        recorded.append(source_file_name)
+    def _fake_upload(data, destination_blob_name, content_type):
+        assert content_type == "text/html"
+        assert "<" in data  # the rendered HTML itself, not a file path
+        recorded.append(destination_blob_name)
         return "ok"
 
-    monkeypatch.setattr(tools, "_upload_blob_to_gcs", _fake_upload)
+    monkeypatch.setattr(tools, "_upload_string_to_gcs", _fake_upload)
 
     ctx_a = MockToolContext("run_a")
     ctx_b = MockToolContext("run_b")
@@ -123,9 +124,11 @@ def test_save_creative_gallery_html_isolates_concurrent_runs(monkeypatch, tmp_pa
     results = asyncio.run(_both())
 
     assert all(r["status"] == "success" for r in results)
-    assert len(recorded) == 2
-    assert recorded[0] != recorded[1]
-    assert not os.path.exists("creative_portfolio_gallery.html")
+    assert sorted(recorded) == [
+        "run_a/creative_output/creative_portfolio_gallery.html",
+        "run_b/creative_output/creative_portfolio_gallery.html",
+    ]
+    assert not os.listdir(tmp_path)  # no scratch file, bare or otherwise
 
 
 class _FakeBlob:
@@ -133,12 +136,11 @@ class _FakeBlob:
         self.name = name
         self._uploads = uploads
 
-    def download_to_file(self, file_obj):
-        file_obj.write(b"origbytes")
+    def download_as_bytes(self):
+        return b"origbytes"
 
-    def upload_from_filename(self, path):
-        assert os.path.exists(path), path
-        self._uploads.append((self.name, path))
+    def upload_from_string(self, data, content_type=None):
+        self._uploads.append((self.name, data, content_type))
 
 
 class _FakeBucket:
@@ -158,19 +160,24 @@ class _FakeStorageClient:
 
 
 class _FakeResized:
-    def save(self, path):
-        with open(path, "wb") as f:
-            f.write(b"resized")
+    def __init__(self, size):
+        self.size = size
+
+    def save(self, fp, format=None):
+        fp.write(f"{format}:{self.size[0]}x{self.size[1]}".encode())
 
 
 class _FakeImg:
     size = (10, 10)
 
-    def resize(self, size, resample):
-        return _FakeResized()
+    def __enter__(self):
+        return self
 
-    def close(self):
-        pass
+    def __exit__(self, *exc):
+        return False
+
+    def resize(self, size, resample):
+        return _FakeResized(size)
 
 
 class _FakeImage:
@@ -178,16 +185,16 @@ class _FakeImage:
         LANCZOS = 1
 
     @staticmethod
-    def open(path):
-        assert os.path.exists(path), path
+    def open(fp):
+        assert fp.read() == b"origbytes"  # the downloaded bytes, in memory
         return _FakeImg()
 
 
 def test_get_high_res_img_isolates_concurrent_runs(monkeypatch, tmp_path):
     """Two concurrent resizes of the SAME artifact_key (as two runs producing a
-    like-named concept would) must not collide on a shared CWD scratch file, and
-    must leave no bare local_*/XL_* files behind. Also guards the gotcha: the GCS
-    object name must be the file basename, not the temp-dir path."""
+    like-named concept would) must upload to per-run objects and stage nothing
+    on local disk (download, resize and re-encode happen in memory). Also guards
+    the object name: it keeps the historical ``resized/XL_local_<key>`` form."""
     monkeypatch.chdir(tmp_path)
     uploads: list[tuple[str, str]] = []
     monkeypatch.setattr(gcs_tools, "_get_gcs_client", lambda: _FakeStorageClient(uploads))
@@ -204,12 +211,11 @@ def test_get_high_res_img_isolates_concurrent_runs(monkeypatch, tmp_path):
         uris = list(ex.map(_call, ["run_a", "run_b"]))
 
     assert all(u for u in uris)  # both returned a URI
-    assert len(uploads) == 2
-    xl_paths = [p for _, p in uploads]
-    assert xl_paths[0] != xl_paths[1]  # per-run isolation
-    # no bare scratch files leaked into CWD
-    assert not os.path.exists("local_concept.png")
-    assert not os.path.exists("XL_local_concept.png")
-    # gotcha: blob name uses the basename, not the temp-dir path
-    for name, _ in uploads:
-        assert name.endswith("resized/XL_local_concept.png"), name
+    assert sorted(name for name, _, _ in uploads) == [
+        "run_a/creative_output/resized/XL_local_concept.png",
+        "run_b/creative_output/resized/XL_local_concept.png",
+    ]  # per-run isolation
+    for _, data, content_type in uploads:
+        assert data == b"PNG:15x15"  # 1.5x, PNG-encoded
+        assert content_type == "image/png"
+    assert not os.listdir(tmp_path)  # no scratch files at all
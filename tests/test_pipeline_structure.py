@@ -543,7 +543,21 @@ def test_trend_scout_split_agents_have_finish_reason_callback():
     )
 
     for a in (understand_trends_searcher, understand_trends_synthesizer):
-        assert a.after_model_callback is log_empty_turn_finish_reason
+        assert log_empty_turn_finish_reason in a.canonical_after_model_callbacks
+
+
+def test_trend_scout_searcher_uses_research_cache():
+    """The searcher checks the daily research cache BEFORE the rate limiter (a hit
+    skips the model call) and writes its final findings back after the turn."""
+    from trend_scout import callbacks
+    from trend_scout.agent import understand_trends_searcher
+
+    before = understand_trends_searcher.canonical_before_model_callbacks
+    assert before.index(callbacks.load_cached_research) < before.index(
+        callbacks.rate_limit_callback
+    )
+    after = understand_trends_searcher.canonical_after_model_callbacks
+    assert callbacks.store_cached_research in after
 
 
 def test_creative_root_has_final_state_summary():
@@ -604,16 +618,19 @@ def test_trend_scout_root_has_expected_tools():
     ]
     expected = [
         "gather_trends_agent",
-        "understand_trends_agent_resilient",
-        "pick_trends_agent",
-        "save_search_trends_to_session_state",
+        "research_and_pick_trends_agent",
+        "save_all_search_trends",
         "save_session_state_to_gcs",
         "write_trends_to_bq",
         "write_to_file",
+        "finalize_outputs",
         "memorize",
     ]
     for name in expected:
         assert name in tool_names, f"Missing tool: {name}"
+    # The per-term save loop was replaced by one batched call; offering both
+    # would let the orchestrator fall back to the per-term loop.
+    assert "save_search_trends_to_session_state" not in tool_names
 
 
 def test_trend_scout_exposes_resumable_app():
@@ -642,17 +659,56 @@ def test_trend_scout_registers_review_trends_tool():
 def test_trend_scout_instruction_branches_on_interactive_flag():
     """The pick phase must branch on the optional `{interactive_trend_pick?}` var:
     the interactive branch calls `review_trends`, and BOTH branches call
-    `pick_trends_agent` (the interactive branch repurposes it to narrate the
-    human's already-chosen trends into `selected_gtrends` for the handoff UI)."""
+    `research_and_pick_trends_agent` (the interactive branch repurposes its pick
+    half to narrate the human's already-chosen trends into `selected_gtrends`
+    for the handoff UI)."""
     from trend_scout.agent import root_agent
 
     instr = str(root_agent.instruction)
     assert "{interactive_trend_pick?}" in instr
     assert "review_trends" in instr
-    assert "pick_trends_agent" in instr
-    # regression: the interactive branch must NOT skip pick_trends_agent, or the
+    assert instr.count("Call `research_and_pick_trends_agent`") == 2
+    # regression: the interactive branch must NOT skip the pick, or the
     # frontend handoff (gated on selected_gtrends) never renders.
-    assert "Do NOT call `pick_trends_agent`" not in instr
+    assert "Do NOT call `research_and_pick_trends_agent`" not in instr
+
+
+def test_trend_scout_instruction_saves_trends_in_one_call():
+    """Both branches persist the picks with ONE batched `save_all_search_trends`
+    call instead of a per-term `save_search_trends_to_session_state` loop (each
+    loop iteration cost an orchestrator turn + a session-state write)."""
+    from trend_scout.agent import root_agent
+
+    instr = str(root_agent.instruction)
+    assert "save_all_search_trends" in instr
+    assert "For each trending topic" not in instr
+
+
+def test_trend_scout_hands_off_before_persistence_completes():
+    """The handoff summary (everything it needs is already in state) is emitted
+    in the same turn as the persistence calls, not after all three GCS/BQ
+    round-trips finish."""
+    from trend_scout.agent import root_agent
+
+    instr = str(root_agent.instruction)
+    handoff = instr.index("Output the handoff summary")
+    assert instr.index("record_research_gaps") < handoff
+    assert handoff < instr.index("Phase 4: Confirmation")
+    assert "Refuse to output any conversational text" not in instr
+    # The confirmation turn is one line; it must not re-print the handoff.
+    confirmation = instr[instr.index("Phase 4: Confirmation") :]
+    assert "**Saved:**" in confirmation
+    assert "**Cloud Storage Location:**" not in confirmation
+    assert "**Selected Strategy:**" not in confirmation
+
+
+def test_trend_scout_persists_with_one_finalize_call():
+    """The three independent BQ/GCS writes go through ONE `finalize_outputs` call
+    (run concurrently) instead of three orchestrator tool calls."""
+    from trend_scout.agent import root_agent
+
+    instr = str(root_agent.instruction)
+    assert "call `finalize_outputs` ONCE" in instr
 
 
 def test_pick_trends_agent_enriches_human_selected_trends():
@@ -697,17 +753,19 @@ def test_understand_trends_searcher_has_tool_synthesizer_is_tool_free():
 def test_understand_trends_is_retry_wrapped():
     """WS2: understand_trends is split into searcher + synthesizer, wrapped as a
     SequentialAgent inside the existing RetryUntilKeyAgent so an empty turn
-    retries the pair instead of crashing pick_trends_agent. The wrapper is still
-    exposed to the orchestrator as an AgentTool."""
+    retries the pair instead of crashing pick_trends_agent. The wrapper runs
+    first inside the research -> pick AgentTool the orchestrator calls."""
     from agent_common import RetryUntilKeyAgent
     from google.adk.agents import SequentialAgent
     from google.adk.tools.agent_tool import AgentTool
     from trend_scout.agent import root_agent
 
     wrapped = [
-        t.agent
+        a
         for t in root_agent.tools
-        if isinstance(t, AgentTool) and isinstance(t.agent, RetryUntilKeyAgent)
+        if isinstance(t, AgentTool)
+        for a in [t.agent, *t.agent.sub_agents]
+        if isinstance(a, RetryUntilKeyAgent)
     ]
     matching = [a for a in wrapped if a.output_key == "info_gtrends"]
     assert matching, "no AgentTool wraps a RetryUntilKeyAgent producing info_gtrends"
@@ -718,6 +776,30 @@ def test_understand_trends_is_retry_wrapped():
     assert pair.sub_agents[-1].output_key == "info_gtrends"
 
 
+def test_research_and_pick_run_in_one_orchestrator_call():
+    """Research feeds the pick and nothing else, so both run inside ONE AgentTool
+    (a SequentialAgent: resilient research first, then the pick) — saving the
+    orchestrator a model turn per run."""
+    from google.adk.agents import SequentialAgent
+    from google.adk.tools.agent_tool import AgentTool
+    from trend_scout.agent import (
+        pick_trends_agent,
+        research_and_pick_trends_agent,
+        root_agent,
+        understand_trends_agent_resilient,
+    )
+
+    assert isinstance(research_and_pick_trends_agent, SequentialAgent)
+    assert research_and_pick_trends_agent.sub_agents == [
+        understand_trends_agent_resilient,
+        pick_trends_agent,
+    ]
+    tool_agents = [t.agent for t in root_agent.tools if isinstance(t, AgentTool)]
+    assert research_and_pick_trends_agent in tool_agents
+    assert understand_trends_agent_resilient not in tool_agents
+    assert pick_trends_agent not in tool_agents
+
+
 def test_pick_trends_info_gtrends_optional():
     """pick_trends_agent must tolerate a missing info_gtrends (orchestrator-skip
     or retry-exhaustion) via the optional `{info_gtrends?}` template syntax rather
@@ -728,6 +810,51 @@ def test_pick_trends_info_gtrends_optional():
     assert "{info_gtrends}" not in pick_trends_agent.instruction
 
 
+def test_trend_agents_keep_a_static_prompt_prefix():
+    """Research/pick agents send their role + steps + output format as a
+    byte-identical `static_instruction` (cacheable prefix); only the per-run
+    `<CONTEXT>` lives in the templated `instruction`."""
+    import re
+
+    from trend_scout.agent import (
+        pick_trends_agent,
+        understand_trends_searcher,
+        understand_trends_synthesizer,
+    )
+
+    state_var = re.compile(r"\{[A-Za-z_][A-Za-z0-9_]*\??\}")
+    for a in (
+        understand_trends_searcher,
+        understand_trends_synthesizer,
+        pick_trends_agent,
+    ):
+        assert a.static_instruction, f"{a.name} has no static prefix"
+        assert not state_var.search(str(a.static_instruction)), a.name
+        assert "<CONTEXT>" in a.instruction
+
+
+def test_understand_trends_searcher_thinking_is_bounded():
+    """The searcher discards its thoughts, so its thinking is capped at LOW
+    rather than left at the model's default level."""
+    from google.genai import types
+
+    from trend_scout.agent import understand_trends_searcher
+
+    cfg = understand_trends_searcher.planner.thinking_config
+    assert cfg.thinking_level == types.ThinkingLevel.LOW
+    assert cfg.include_thoughts is False
+
+
+def test_gather_trends_prompt_is_not_templated():
+    """The gather prompt has no state vars, so it ships as a literal
+    `static_instruction` instead of being re-interpolated on every call."""
+    from trend_scout.agent import gather_trends_agent
+
+    assert gather_trends_agent.static_instruction
+    assert not gather_trends_agent.instruction
+    assert "{" not in str(gather_trends_agent.static_instruction)
+
+
 def test_understand_trends_searcher_raw_gtrends_is_optional():
     """The searcher must tolerate a missing raw_gtrends (e.g. gather skipped or the
     gather tool errored) via the optional `{raw_gtrends?}` template syntax rather
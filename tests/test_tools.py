@@ -1,6 +1,7 @@
 """Tests for backend tool functions (pure logic, no external service calls)."""
 
 import string
+import types as pytypes
 
 import pytest
 
@@ -50,6 +51,43 @@ class MockToolContext:
         self.state = MockState()
 
 
+class FakeBigQueryClient:
+    """Stand-in for ``bigquery.Client``: returns canned rows from
+    ``query_and_wait`` and a finished DML job from ``query``, recording every
+    ``(sql, job_config)`` it is asked to run in ``calls``."""
+
+    def __init__(self, rows=(), errors=None, affected_rows=1):
+        self.rows = list(rows)
+        self.errors = errors
+        self.affected_rows = affected_rows
+        self.calls = []
+
+    def query(self, sql, job_config=None):
+        self.calls.append((sql, job_config))
+        return pytypes.SimpleNamespace(
+            errors=self.errors,
+            job_id="j1",
+            num_dml_affected_rows=self.affected_rows,
+            result=lambda: None,
+        )
+
+    def query_and_wait(self, sql, job_config=None):
+        self.calls.append((sql, job_config))
+        return iter(self.rows)
+
+
+@pytest.fixture
+def fake_bq(monkeypatch):
+    """Install a ``FakeBigQueryClient`` as ``module._get_bigquery_client``."""
+
+    def install(module, **kwargs):
+        client = FakeBigQueryClient(**kwargs)
+        monkeypatch.setattr(module, "_get_bigquery_client", lambda: client)
+        return client
+
+    return install
+
+
 class TestMemorizeTool:
     def test_memorize_stores_value(self):
         from creative_agent.tools import memorize
@@ -146,7 +184,7 @@ class TestBuildTrendInsertSql:
         params = dict(
             table="hybrid-vertex.trend_trawler.target_trends_crf",
             unique_id="abcd1234",
-            trend="Golden Dip",
+            trends=["Golden Dip"],
             max_date="07/15/2026",
             current_date="07/15/2026",
             trawler_gcs="https://console.cloud.google.com/storage/browser/b/f/d",
@@ -163,7 +201,8 @@ class TestBuildTrendInsertSql:
     def _param_value(params, name):
         for p in params:
             if p.name == name:
-                return p.value
+                # ArrayQueryParameter exposes `values`; scalars expose `value`.
+                return p.values if hasattr(p, "values") else p.value
         raise AssertionError(f"query parameter {name!r} not found")
 
     def test_includes_research_gaps_column_and_trend(self):
@@ -173,7 +212,7 @@ class TestBuildTrendInsertSql:
         assert "research_gaps" in sql
         assert "target_trends_crf" in sql
         assert "Golden Dip" not in sql
-        assert self._param_value(params, "trend") == "Golden Dip"
+        assert self._param_value(params, "trends") == ["Golden Dip"]
 
     def test_research_gaps_value_bound_as_parameter(self):
         note = "Step 'info_gtrends' exhausted retries and produced no output."
@@ -198,37 +237,138 @@ class TestBuildTrendInsertSql:
         # regression for the 400 "Expected ) or , but got identifier" error: a
         # trend containing a double quote used to break the INSERT literal.
         tricky = 'The "Prophetic" Trend'
-        sql, params = self._sql(trend=tricky)
+        sql, params = self._sql(trends=[tricky])
         assert tricky not in sql
-        assert self._param_value(params, "trend") == tricky
+        assert self._param_value(params, "trends") == [tricky]
+
+    def test_all_trends_inserted_by_one_statement(self):
+        # one DML job per run, not one per trend: every selected trend rides in
+        # the @trends array and the statement fans it out via UNNEST.
+        trends = ["Golden Dip", "tswift engaged", "aurora"]
+        sql, params = self._sql(trends=trends)
+        assert sql.count("INSERT INTO") == 1
+        assert "UNNEST(@trends)" in sql
+        assert self._param_value(params, "trends") == trends
+
+
+# --- trend_scout client getters ---
+class TestTrendScoutClientsAreCached:
+    @pytest.mark.parametrize(
+        "getter, factory, module_attr",
+        [
+            ("_get_gcs_client", "get_gcs_client", "storage"),
+            ("_get_bigquery_client", "get_bigquery_client", "bigquery"),
+        ],
+    )
+    def test_client_built_once_per_process(
+        self, monkeypatch, getter, factory, module_attr
+    ):
+        import trend_scout.tools as t
+        from agent_common import clients
 
+        built = []
+        monkeypatch.setattr(
+            getattr(clients, module_attr),
+            "Client",
+            lambda **kw: built.append(kw) or object(),
+        )
+        shared = getattr(clients, factory)
+        shared.cache_clear()
+        try:
+            get = getattr(t, getter)
+            assert get() is get()
+            # the package wrapper hands out the shared per-project client
+            assert get() is shared(built[0]["project"])
+            assert len(built) == 1
+        finally:
+            shared.cache_clear()
+
+
+def test_trend_scout_tools_import_makes_no_bigquery_call():
+    """Module top level must not query BigQuery (it used to resolve max_date)."""
+    import ast
+    import inspect
+
+    import trend_scout.tools as t
+
+    tree = ast.parse(inspect.getsource(t))
+    top_level_calls = {
+        node.func.id
+        for stmt in tree.body
+        if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef))
+        for node in ast.walk(stmt)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+    assert not top_level_calls & {
+        "_get_gtrends_max_date",
+        "_get_bigquery_client",
+        "_get_gcs_client",
+    }
+
+
+# --- get_daily_gtrends markdown rendering (pure, offline) ---
+class TestFormatTrendsMarkdown:
+    def test_renders_header_and_one_row_per_trend(self):
+        from trend_scout.tools import _format_trends_markdown
+
+        md = _format_trends_markdown(
+            [("golden dip", 1, "2026-07-15"), ("tswift engaged", 2, "2026-07-15")]
+        )
+        assert md.splitlines() == [
+            "| term | rank | refresh_date |",
+            "|---|---|---|",
+            "| golden dip | 1 | 2026-07-15 |",
+            "| tswift engaged | 2 | 2026-07-15 |",
+        ]
 
-# --- save_search_trends_to_session_state logic ---
-class TestSaveSearchTrends:
-    def test_appends_trend_to_existing_list(self):
-        from trend_scout.tools import save_search_trends_to_session_state
+    def test_pipe_in_term_is_escaped(self):
+        from trend_scout.tools import _format_trends_markdown
+
+        md = _format_trends_markdown([("a | b", 1, "2026-07-15")])
+        assert md.splitlines()[-1] == "| a \\| b | 1 | 2026-07-15 |"
+
+    def test_empty_rows_is_header_only(self):
+        from trend_scout.tools import _format_trends_markdown
+
+        assert len(_format_trends_markdown([]).splitlines()) == 2
 
-        ctx = MockToolContext()
-        ctx.state["target_search_trends"] = {"target_search_trends": ["trend_a"]}
 
-        result = save_search_trends_to_session_state("trend_b", ctx)
-        assert result["status"] == "ok"
-        trends = ctx.state["target_search_trends"]["target_search_trends"]
-        assert "trend_a" in trends
-        assert "trend_b" in trends
+# --- save_all_search_trends logic ---
+class TestSaveAllSearchTrends:
+    def test_saves_all_trends_in_one_call(self):
+        from trend_scout.tools import save_all_search_trends
 
-    def test_appends_first_trend_to_empty_init_state(self):
-        """The initial state is {"target_search_trends": []}; the first trend
-        must still be appended (regression guard for the old identity check)."""
-        from trend_scout.tools import save_search_trends_to_session_state
+        ctx = MockToolContext()
+        result = save_all_search_trends(["trend_a", "trend_b", "trend_c"], ctx)
+        assert result == {"status": "ok", "count": 3}
+        assert ctx.state["target_search_trends"] == {
+            "target_search_trends": ["trend_a", "trend_b", "trend_c"]
+        }
+
+    def test_replaces_rather_than_appends(self):
+        """One batched write is the whole selection, so a re-call (e.g. an LLM
+        retry) must not duplicate terms."""
+        from trend_scout.tools import save_all_search_trends
 
         ctx = MockToolContext()
-        ctx.state["target_search_trends"] = {"target_search_trends": []}
+        ctx.state["target_search_trends"] = {"target_search_trends": ["trend_a"]}
+        save_all_search_trends(["trend_a", "trend_b"], ctx)
+        assert ctx.state["target_search_trends"]["target_search_trends"] == [
+            "trend_a",
+            "trend_b",
+        ]
+
+    def test_dedupes_keeping_first_spelling_and_order(self):
+        from trend_scout.tools import save_all_search_trends
 
-        result = save_search_trends_to_session_state("trend_a", ctx)
-        assert result["status"] == "ok"
-        trends = ctx.state["target_search_trends"]["target_search_trends"]
-        assert trends == ["trend_a"]
+        ctx = MockToolContext()
+        result = save_all_search_trends(["A", "b", " a", "C", "B"], ctx)
+        assert result == {"status": "ok", "count": 3}
+        assert ctx.state["target_search_trends"]["target_search_trends"] == [
+            "A",
+            "b",
+            "C",
+        ]
 
 
 # --- build_eval_bq_row (pure eval-report -> BQ row) ---
@@ -370,30 +510,14 @@ class TestResearchWarningBanner:
 
 
 class TestWriteTrendsUuidStash:
-    def test_stashes_creative_row_uuid(self, monkeypatch):
+    def test_stashes_creative_row_uuid(self, fake_bq):
         """write_trends_to_bq must record its generated uuid in state so the
         eval row can foreign-key back to the creative row."""
         # write_trends_to_bq now lives in creative_agent.bq_tools (re-exported from
         # tools); patch/call it there so the _get_bigquery_client stub takes effect.
         import creative_agent.bq_tools as t
 
-        class _Job:
-            errors = None
-            job_id = "j1"
-            num_dml_affected_rows = 1
-
-            def result(self):
-                return None
-
-        captured = {}
-
-        class _BQ:
-            def query(self, sql, job_config=None):
-                captured["sql"] = sql
-                captured["job_config"] = job_config
-                return _Job()
-
-        monkeypatch.setattr(t, "_get_bigquery_client", lambda: _BQ())
+        bq = fake_bq(t)
 
         ctx = MockToolContext()
         ctx.state.update(
@@ -412,35 +536,146 @@ class TestWriteTrendsUuidStash:
         assert ctx.state["creative_row_uuid"]  # non-empty 8-char id
         assert len(ctx.state["creative_row_uuid"]) == 8
         # the trend value must be a bound parameter, not interpolated into SQL
-        assert "tswift engaged" not in captured["sql"]
-        param_names = {p.name for p in captured["job_config"].query_parameters}
+        sql, job_config = bq.calls[0]
+        assert "tswift engaged" not in sql
+        param_names = {p.name for p in job_config.query_parameters}
         assert "target_trend" in param_names
 
 
+class TestTrendScoutWriteTrendsBatched:
+    def test_one_query_job_for_all_selected_trends(self, fake_bq, monkeypatch):
+        """Every selected trend is inserted by a single DML job, not one per trend."""
+        import trend_scout.tools as t
+
+        bq = fake_bq(t, affected_rows=3)
+        monkeypatch.setattr(t, "_get_gtrends_max_date", lambda: "07/17/2026")
+
+        trends = ["tswift engaged", "golden dip", "aurora"]
+        ctx = MockToolContext()
+        ctx.state.update(
+            {
+                "gcs_folder": "2026_07_13_run",
+                "agent_output_dir": "trawler_output",
+                "target_search_trends": {"target_search_trends": trends},
+                "brand": "PRS",
+                "target_audience": "musicians",
+                "target_product": "SE CE24",
+                "key_selling_points": "wide tonal range",
+            }
+        )
+        result = t.write_trends_to_bq(ctx)
+        assert result["status"] == "success"
+        assert len(bq.calls) == 1
+        bound = {p.name: p for p in bq.calls[0][1].query_parameters}
+        assert list(bound["trends"].values) == trends
+
+    def test_reuses_refresh_date_recorded_by_get_daily_gtrends(
+        self, fake_bq, monkeypatch
+    ):
+        import trend_scout.tools as t
+
+        def no_lookup():
+            raise AssertionError("max date should come from session state")
+
+        fake_bq(t)
+        monkeypatch.setattr(t, "_get_gtrends_max_date", no_lookup)
+
+        ctx = MockToolContext()
+        ctx.state.update(
+            {
+                "gtrends_max_date": "07/17/2026",
+                "gcs_folder": "2026_07_13_run",
+                "agent_output_dir": "trawler_output",
+                "target_search_trends": {"target_search_trends": ["aurora"]},
+                "brand": "PRS",
+                "target_audience": "musicians",
+                "target_product": "SE CE24",
+                "key_selling_points": "wide tonal range",
+            }
+        )
+        assert t.write_trends_to_bq(ctx)["status"] == "success"
+
+
+class TestGetDailyGtrendsSingleJob:
+    def test_one_job_and_records_refresh_date(self, fake_bq, monkeypatch):
+        """The latest-date lookup and the trends select run as one script job."""
+        import datetime
+
+        import trend_scout.tools as t
+
+        refresh = datetime.date(2026, 7, 17)
+        bq = fake_bq(
+            t,
+            rows=[
+                {"term": "golden dip", "refresh_date": refresh},
+                {"term": "aurora", "refresh_date": refresh},
+            ],
+        )
+
+        def no_lookup():
+            raise AssertionError("max date must be resolved inside the one job")
+
+        monkeypatch.setattr(t, "_get_gtrends_max_date", no_lookup)
+
+        ctx = MockToolContext()
+        md = t.get_daily_gtrends(ctx)
+        assert len(bq.calls) == 1
+        sql, job_config = bq.calls[0]
+        # reads are cost-bounded by the shared, import-time job config
+        assert job_config is t._GTRENDS_JOB_CONFIG
+        assert job_config.maximum_bytes_billed
+        # the latest date comes from partition metadata, not a column scan
+        assert "INFORMATION_SCHEMA.PARTITIONS" in sql
+        assert "MAX(refresh_date)" not in sql
+        assert "LIMIT 25" in sql  # bounded to the documented 25 rows
+        assert ctx.state["gtrends_max_date"] == "07/17/2026"
+        assert ctx.state["raw_gtrends"] == ["golden dip", "aurora"]
+        assert "| aurora | 2 | 2026-07-17 |" in md
+
+    def test_fallback_max_date_reads_scalar_without_dataframe(self, fake_bq):
+        import datetime
+
+        import trend_scout.tools as t
+
+        bq = fake_bq(t, rows=[{"max_date": datetime.date(2026, 7, 17)}])
+        t._gtrends_max_date_for_hour.cache_clear()
+        try:
+            assert t._get_gtrends_max_date() == "07/17/2026"
+            assert bq.calls[0][1].maximum_bytes_billed
+        finally:
+            t._gtrends_max_date_for_hour.cache_clear()
+
+    def test_fallback_max_date_is_queried_once_per_hour(self, fake_bq):
+        import datetime
+
+        import trend_scout.tools as t
+
+        bq = fake_bq(t, rows=[{"max_date": datetime.date(2026, 7, 17)}])
+        t._gtrends_max_date_for_hour.cache_clear()
+        try:
+            hour = datetime.datetime(2026, 7, 17, 9, tzinfo=datetime.UTC)
+            assert t._gtrends_max_date_for_hour(hour) == "07/17/2026"
+            assert t._gtrends_max_date_for_hour(hour) == "07/17/2026"
+            assert len(bq.calls) == 1
+            # a partition that lands later in the day is picked up next hour
+            t._gtrends_max_date_for_hour(hour + datetime.timedelta(hours=1))
+            assert len(bq.calls) == 2
+        finally:
+            t._gtrends_max_date_for_hour.cache_clear()
+
+
 class TestWriteTrendsRaisesOnBqErrors:
     """A BigQuery insert that reports job-level errors must NOT be reported as
     success (silent data loss). Both write_trends_to_bq implementations must
     raise, matching write_eval_report_to_bq's contract, so ADK RetryConfig can
     retry and a genuine failure surfaces instead of masquerading as success."""
 
-    class _FailingJob:
-        errors = [{"reason": "invalid", "message": "boom"}]
-        job_id = "j-fail"
-        num_dml_affected_rows = 0
+    _ERRORS = [{"reason": "invalid", "message": "boom"}]
 
-        def result(self):
-            return None
-
-    def test_creative_agent_write_trends_raises(self, monkeypatch):
+    def test_creative_agent_write_trends_raises(self, fake_bq):
         import creative_agent.bq_tools as t
 
-        outer = self
-
-        class _BQ:
-            def query(self, sql, job_config=None):
-                return outer._FailingJob()
-
-        monkeypatch.setattr(t, "_get_bigquery_client", lambda: _BQ())
+        fake_bq(t, errors=self._ERRORS, affected_rows=0)
 
         ctx = MockToolContext()
         ctx.state.update(
@@ -457,16 +692,10 @@ class TestWriteTrendsRaisesOnBqErrors:
         with pytest.raises(RuntimeError, match="BigQuery insert returned errors"):
             t.write_trends_to_bq(ctx)
 
-    def test_trend_scout_write_trends_raises(self, monkeypatch):
+    def test_trend_scout_write_trends_raises(self, fake_bq, monkeypatch):
         import trend_scout.tools as t
 
-        outer = self
-
-        class _BQ:
-            def query(self, sql, job_config=None):
-                return outer._FailingJob()
-
-        monkeypatch.setattr(t, "_get_bigquery_client", lambda: _BQ())
+        fake_bq(t, errors=self._ERRORS, affected_rows=0)
         # avoid the live max-date lookup used to build the insert SQL
         monkeypatch.setattr(t, "_get_gtrends_max_date", lambda: "2026-07-17")
 
@@ -41,10 +41,6 @@ class TestTrendTrawlerToolsPropagate:
     def test_get_daily_gtrends_raises_on_transient(self, monkeypatch):
         from trend_scout import tools
 
-        # _get_gtrends_max_date runs before the try; stub it so we reach the
-        # in-try client acquisition, where the transient must propagate.
-        monkeypatch.setattr(tools, "_get_gtrends_max_date", lambda: "07/01/2026")
-
         def boom():
             raise api_exceptions.InternalServerError("500")
 
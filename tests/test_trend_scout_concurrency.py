@@ -10,10 +10,16 @@ run's write → wrong-data upload or ``FileNotFoundError``.
 
 These tests reproduce the race deterministically in-process (two invocations via
 ``ThreadPoolExecutor``) and assert per-run isolation + zero bare-CWD leaks — no GCP.
+Both tools now upload straight from memory (``upload_from_string``), so there is
+no scratch file at all; the tests check the per-run object key + content.
 """
 
+import asyncio
+import gzip
 import json
+import logging
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
 from trend_scout import tools
@@ -38,11 +44,8 @@ class _FakeBlob:
         self.name = name
         self._uploads = uploads
 
-    def upload_from_filename(self, path):
-        # The scratch file must still exist on disk at upload time (a racing
-        # rmtree would have deleted it under the old code).
-        assert os.path.exists(path), path
-        self._uploads.append((self.name, path))
+    def upload_from_string(self, data, content_type=None):
+        self._uploads.append((self.name, data))
 
 
 class _FakeBucket:
@@ -62,9 +65,9 @@ class _FakeStorageClient:
 
 
 def test_write_to_file_isolates_concurrent_runs(monkeypatch, tmp_path):
-    """Two concurrent ``write_to_file`` calls must use DISTINCT scratch paths,
-    produce per-run-distinct GCS object names, and leave no bare
-    ``trawler_output`` directory in the CWD."""
+    """Two concurrent ``write_to_file`` calls must upload their OWN content to
+    per-run-distinct GCS object names, and leave no bare ``trawler_output``
+    directory in the CWD."""
     monkeypatch.chdir(tmp_path)
     uploads: list[tuple[str, str]] = []
     monkeypatch.setattr(tools, "_get_gcs_client", lambda: _FakeStorageClient(uploads))
@@ -77,16 +80,17 @@ def test_write_to_file_isolates_concurrent_runs(monkeypatch, tmp_path):
 
     assert all(r["status"] == "success" for r in results)
     assert len(uploads) == 2
-    scratch_paths = [p for _, p in uploads]
-    assert scratch_paths[0] != scratch_paths[1]  # per-run isolation
-    object_names = [n for n, _ in uploads]
-    assert sorted(object_names) == ["run_a/selected_trends.txt", "run_b/selected_trends.txt"]
+    assert dict(uploads) == {
+        "run_a/selected_trends.txt": "# trends for run_a",
+        "run_b/selected_trends.txt": "# trends for run_b",
+    }  # per-run isolation
     assert not os.path.exists("trawler_output")  # no bare CWD artifact leak
+    assert not os.listdir(tmp_path)  # nothing staged on local disk at all
 
 
 def test_save_session_state_isolates_concurrent_runs(monkeypatch, tmp_path):
-    """Two concurrent ``save_session_state_to_gcs`` calls must isolate scratch
-    files and leave no bare ``trawler_output`` directory in the CWD."""
+    """Two concurrent ``save_session_state_to_gcs`` calls must upload their OWN
+    state to per-run object names, and stage nothing on local disk."""
     monkeypatch.chdir(tmp_path)
     uploads: list[tuple[str, str]] = []
     monkeypatch.setattr(tools, "_get_gcs_client", lambda: _FakeStorageClient(uploads))
@@ -99,28 +103,26 @@ def test_save_session_state_isolates_concurrent_runs(monkeypatch, tmp_path):
 
     assert all(r["status"] == "success" for r in results)
     assert len(uploads) == 2
-    scratch_paths = [p for _, p in uploads]
-    assert scratch_paths[0] != scratch_paths[1]  # per-run isolation
-    object_names = [n for n, _ in uploads]
-    assert sorted(object_names) == [
-        "run_a/trawler_session_state.json",
-        "run_b/trawler_session_state.json",
-    ]
+    by_name = {
+        n: json.loads(gzip.decompress(data))["gcs_folder"] for n, data in uploads
+    }
+    assert by_name == {
+        "run_a/trawler_session_state.json": "run_a",
+        "run_b/trawler_session_state.json": "run_b",
+    }  # per-run isolation
     assert not os.path.exists("trawler_output")
+    assert not os.listdir(tmp_path)  # nothing staged on local disk at all
 
 
 def test_write_to_file_uploads_correct_content(monkeypatch, tmp_path):
-    """Guard against the race's *silent* failure mode: the uploaded scratch file
-    must contain THIS run's content (not another run's), so the object key uses
-    the file basename and the temp dir never leaks into it."""
+    """Guard against the race's *silent* failure mode: the upload must carry
+    THIS run's content (not another run's) under the run's own object key."""
     monkeypatch.chdir(tmp_path)
     captured: dict[str, str] = {}
 
     class _CapBlob(_FakeBlob):
-        def upload_from_filename(self, path):
-            assert os.path.exists(path), path
-            with open(path) as f:
-                captured[self.name] = f.read()
+        def upload_from_string(self, data, content_type=None):
+            captured[self.name] = data
 
     class _CapBucket(_FakeBucket):
         def blob(self, name):
@@ -137,15 +139,16 @@ def test_write_to_file_uploads_correct_content(monkeypatch, tmp_path):
 
 
 def test_save_session_state_uploads_valid_json(monkeypatch, tmp_path):
-    """The session-state export must upload parseable JSON of this run's state."""
+    """The session-state export must upload parseable (gzip-encoded) JSON of
+    this run's state."""
     monkeypatch.chdir(tmp_path)
     captured: dict[str, str] = {}
 
     class _CapBlob(_FakeBlob):
-        def upload_from_filename(self, path):
-            assert os.path.exists(path), path
-            with open(path) as f:
-                captured[self.name] = f.read()
+        def upload_from_string(self, data, content_type=None):
+            assert content_type == "application/json"
+            assert self.content_encoding == "gzip"
+            captured[self.name] = gzip.decompress(data)
 
     class _CapBucket(_FakeBucket):
         def blob(self, name):
@@ -163,3 +166,66 @@ def test_save_session_state_uploads_valid_json(monkeypatch, tmp_path):
 
     parsed = json.loads(captured["solo/trawler_session_state.json"])
     assert parsed["some_key"] == "some_value"
+
+
+def test_finalize_outputs_runs_the_three_writes_concurrently(monkeypatch):
+    """``finalize_outputs`` must overlap the BQ insert and the two GCS uploads:
+    each fake write blocks until all three have started, which would deadlock
+    (and trip the barrier timeout) if they ran one after another."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _write(name):
+        def _fn(*args):
+            barrier.wait()
+            return {"status": "success", "step": name}
+
+        return _fn
+
+    for name in ("write_trends_to_bq", "write_to_file", "save_session_state_to_gcs"):
+        monkeypatch.setattr(tools, name, _write(name))
+
+    ctx = MockToolContext("2026_07_13_run")
+    result = asyncio.run(tools.finalize_outputs(ctx))
+
+    assert result["status"] == "success"
+    assert result["failed"] == []
+    assert result["write_to_file"]["step"] == "write_to_file"
+    assert ctx.state["select_trends_markdown_gcs_uri"].endswith(
+        "/2026_07_13_run/selected_trends.txt"
+    )
+
+
+def test_finalize_outputs_reports_partial_failure_without_raising(monkeypatch):
+    """A partial failure must NOT raise (an ADK retry would re-run the writes that
+    already landed, e.g. duplicate BQ rows); it names the failed write instead."""
+
+    def ok(*args):
+        return {"status": "success"}
+
+    def boom(*args):
+        raise RuntimeError("503")
+
+    monkeypatch.setattr(tools, "write_trends_to_bq", ok)
+    monkeypatch.setattr(tools, "write_to_file", ok)
+    monkeypatch.setattr(tools, "save_session_state_to_gcs", boom)
+
+    result = asyncio.run(tools.finalize_outputs(MockToolContext("run_a")))
+
+    assert result["status"] == "error"
+    assert result["failed"] == ["save_session_state_to_gcs"]
+    assert result["save_session_state_to_gcs"]["status"] == "error"
+
+
+def test_uploads_log_size_and_latency(monkeypatch, caplog):
+    """Each artifact upload logs its on-the-wire size and encoding, the signal
+    used to tune compression/chunking from real runs."""
+    monkeypatch.setattr(tools, "_get_gcs_client", lambda: _FakeStorageClient([]))
+
+    with caplog.at_level(logging.INFO, logger=tools.logger.name):
+        tools.write_to_file("# héllo", MockToolContext("run_a"))
+
+    (record,) = [r for r in caplog.records if r.msg.startswith("Uploaded ")]
+    filename, size, encoding, _elapsed_ms = record.args
+    assert filename == "selected_trends.txt"
+    assert size == len("# héllo".encode())  # bytes, not characters
+    assert encoding == "identity"
@@ -9,12 +9,13 @@ from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools import google_search
 
 from .tools import (
-    save_search_trends_to_session_state,
+    save_all_search_trends,
     save_session_state_to_gcs,
     record_research_gaps,
     write_trends_to_bq,
     get_daily_gtrends,
     write_to_file,
+    finalize_outputs,
     memorize,
 )
 from .review_tools import review_trends_tool
@@ -38,7 +39,8 @@ gather_trends_agent = Agent(
     name="gather_trends_agent",
     include_contents="none",
     description="Get top 25 trending terms from Google Search.",
-    instruction=prompts.GATHER_TRENDS_INSTR,
+    # No `{state}` vars: sent literally, skipping per-call template interpolation.
+    static_instruction=prompts.GATHER_TRENDS_INSTR,
     tools=[get_daily_gtrends],
     retry_config=INFRA_RETRY,
     generate_content_config=types.GenerateContentConfig(
@@ -68,9 +70,15 @@ understand_trends_searcher = Agent(
     name="understand_trends_searcher",
     include_contents="none",
     description="Conduct initial web research to briefly understand each trending topic",
+    # Thoughts are discarded and the task (pick terms, search, list facts) needs
+    # little deliberation, so cap thinking at LOW instead of the model default —
+    # the same bound the root uses. Not MINIMAL: see the root's thinking note.
     planner=BuiltInPlanner(
-        thinking_config=types.ThinkingConfig(include_thoughts=False)
+        thinking_config=types.ThinkingConfig(
+            thinking_level=types.ThinkingLevel.LOW, include_thoughts=False
+        )
     ),
+    static_instruction=prompts.UNDERSTAND_TRENDS_SEARCHER_STATIC_INSTR,
     instruction=prompts.UNDERSTAND_TRENDS_SEARCHER_INSTR,
     generate_content_config=types.GenerateContentConfig(
         temperature=1.5,
@@ -82,8 +90,15 @@ understand_trends_searcher = Agent(
     ),
     tools=[google_search],
     output_key="info_gtrends_raw",
-    before_model_callback=callbacks.rate_limit_callback,
-    after_model_callback=callbacks.log_empty_turn_finish_reason,
+    # Cache lookup first: a hit skips the model call, so it needs no rate slot.
+    before_model_callback=[
+        callbacks.load_cached_research,
+        callbacks.rate_limit_callback,
+    ],
+    after_model_callback=[
+        callbacks.log_empty_turn_finish_reason,
+        callbacks.store_cached_research,
+    ],
 )
 
 
@@ -97,6 +112,7 @@ understand_trends_synthesizer = Agent(
     name="understand_trends_synthesizer",
     include_contents="none",
     description="Synthesizes the raw trend findings into the structured JSON briefing.",
+    static_instruction=prompts.UNDERSTAND_TRENDS_SYNTHESIZER_STATIC_INSTR,
     instruction=prompts.UNDERSTAND_TRENDS_SYNTHESIZER_INSTR,
     generate_content_config=types.GenerateContentConfig(
         temperature=1.5,
@@ -121,16 +137,17 @@ understand_trends_search_and_synthesize = SequentialAgent(
 # Retry-on-empty: if the searcher OR synthesizer emits no final text (leaving
 # `info_gtrends` unset), re-run the whole pair until populated (bounded), instead
 # of crashing pick_trends_agent with `KeyError: Context variable not found`. The
-# wrapper runs only sub_agents[0], so we wrap the SequentialAgent pair. It is
-# exposed to the orchestrator as an AgentTool, so the retry runs inside AgentTool's
-# isolated sub-Runner — state-delta timing across that boundary is identical to the
-# top-level case the wrapper was verified against (agent_tool.py forwards each inner
-# event's state_delta before our generator resumes). Keep the `name` + `description`
-# so AgentTool builds the same tool declaration the orchestrator already knows.
+# wrapper runs only sub_agents[0], so we wrap the SequentialAgent pair. It is not
+# a tool itself: it is the first step of `research_and_pick_trends_agent`, and only
+# that SequentialAgent is exposed to the orchestrator as an AgentTool. The retry
+# therefore runs inside AgentTool's isolated sub-Runner — state-delta timing across
+# that boundary is identical to the top-level case the wrapper was verified against
+# (agent_tool.py forwards each inner event's state_delta before our generator
+# resumes), so `info_gtrends` is set before pick_trends_agent reads it.
 understand_trends_agent_resilient = RetryUntilKeyAgent(
     name="understand_trends_agent_resilient",
-    # Preserve the original tool-facing description so AgentTool builds the same
-    # declaration the orchestrator already calls (the searcher carries it verbatim).
+    # Reuse the searcher's description so the wrapper reads the same in traces
+    # and the agent graph as the search step it retries.
     description=understand_trends_searcher.description,
     sub_agents=[understand_trends_search_and_synthesize],
     output_key="info_gtrends",
@@ -148,6 +165,7 @@ pick_trends_agent = Agent(
     planner=BuiltInPlanner(
         thinking_config=types.ThinkingConfig(include_thoughts=False)
     ),
+    static_instruction=prompts.PICK_TRENDS_STATIC_INSTR,
     instruction=prompts.PICK_TRENDS_INSTR,
     generate_content_config=types.GenerateContentConfig(
         temperature=0.4,
@@ -163,6 +181,23 @@ pick_trends_agent = Agent(
 )
 
 
+# Research -> pick as ONE orchestrator tool call. The pick reads only the
+# research (`{info_gtrends?}`) plus campaign metadata already in state, so there
+# is nothing for the orchestrator to decide between the two — exposing them as
+# separate AgentTools cost an extra root-model turn (prefill + LOW thinking) and
+# round-trip per run. Both output_keys (`info_gtrends`, `selected_gtrends`) still
+# land in parent state via AgentTool's state_delta forwarding, and the
+# retry-on-empty wrapper still guards the research half.
+research_and_pick_trends_agent = SequentialAgent(
+    name="research_and_pick_trends_agent",
+    description=(
+        "Research the gathered (or human-selected) trends, then pick the subset "
+        "most culturally relevant to the target audience."
+    ),
+    sub_agents=[understand_trends_agent_resilient, pick_trends_agent],
+)
+
+
 trend_scout = Agent(
     # Root orchestrator: mechanical tool sequencing that must call AgentTools
     # reliably. gemini-3.1-pro-preview on its own global bucket (thinking_level
@@ -189,14 +224,14 @@ trend_scout = Agent(
     instruction=prompts.TREND_SCOUT_INSTR,
     tools=[
         AgentTool(agent=gather_trends_agent),
-        AgentTool(agent=understand_trends_agent_resilient),
-        AgentTool(agent=pick_trends_agent),
+        AgentTool(agent=research_and_pick_trends_agent),
         review_trends_tool,
-        save_search_trends_to_session_state,
+        save_all_search_trends,
         save_session_state_to_gcs,
         record_research_gaps,
         write_trends_to_bq,
         write_to_file,
+        finalize_outputs,
         memorize,
     ],
     generate_content_config=types.GenerateContentConfig(
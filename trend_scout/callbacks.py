@@ -1,23 +1,27 @@
+import copy
 import uuid
+import asyncio
+import hashlib
 import logging
-import warnings
-import pandas as pd
-from typing import Dict, Any
+import datetime
+from typing import Any
 
+from google.api_core import exceptions as api_exceptions
+from google.genai import types
 from google.adk.sessions.state import State
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
 from google.adk.agents.callback_context import CallbackContext
 
 from agent_common import observability
 from agent_common.rate_limit import build_rate_limit_callback
 
 from .config import config
+from .tools import _get_gcs_client
 
 
-# --- config ---
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-warnings.filterwarnings("ignore")
+# Configured once by the entry point (trend_scout/agent.py).
+logger = logging.getLogger(__name__)
 
 
 # Shared debugging-observability callbacks (extracted to agent_common in WS3).
@@ -28,7 +32,19 @@ log_final_state_summary = observability.make_final_state_summary(
 )
 
 
-def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
+# Default per-session state, built once at import rather than re-constructed on
+# every `load_session_state` call. Deep-copied per session so the nested
+# `target_search_trends` list is never shared across sessions.
+_INITIAL_STATE: dict[str, Any] = {
+    "brand": "",  # BRAND,
+    "target_product": "",  # TARGET_PRODUCT,
+    "target_audience": "",  # TARGET_AUDIENCE,
+    "key_selling_points": "",  # KEY_SELLING_POINT,
+    "target_search_trends": {"target_search_trends": []},
+}
+
+
+def _set_initial_states(source: dict[str, Any], target: State | dict[str, Any]):
     """
     Setting the initial session state given a JSON object of states.
 
@@ -37,13 +53,13 @@ def _set_initial_states(source: Dict[str, Any], target: State | dict[str, Any]):
         target: The session state object to insert into.
     """
     unique_id = f"{str(uuid.uuid4())[:4]}"
-    formatted_now = pd.Timestamp.now("UTC").strftime("%Y_%m_%d_%H_%M")
+    formatted_now = datetime.datetime.now(datetime.UTC).strftime("%Y_%m_%d_%H_%M")
     if config.state_init not in target:
         target[config.state_init] = True
         target["gcs_bucket"] = config.GCS_BUCKET
         target["agent_output_dir"] = "trawler_output"
         target["gcs_folder"] = f"{formatted_now}_{unique_id}"
-        logging.info(f"gcs_folder: {target['gcs_folder']}")
+        logger.info("gcs_folder: %s", target["gcs_folder"])
 
         target.update(source)
 
@@ -59,16 +75,7 @@ def load_session_state(callback_context: CallbackContext):
     """
     observability.log_run_start(callback_context)
 
-    data = {}
-    data["state"] = {
-        "brand": "",  # BRAND,
-        "target_product": "",  # TARGET_PRODUCT,
-        "target_audience": "",  # TARGET_AUDIENCE,
-        "key_selling_points": "",  # KEY_SELLING_POINT,
-        "target_search_trends": {"target_search_trends": []},
-    }
-
-    _set_initial_states(data["state"], callback_context.state)
+    _set_initial_states(copy.deepcopy(_INITIAL_STATE), callback_context.state)
 
     # Opt-in human checkpoint for trend selection (default OFF). Seeded only when
     # absent so the `{interactive_trend_pick?}` instruction var is always defined
@@ -84,3 +91,121 @@ def load_session_state(callback_context: CallbackContext):
 # `callbacks.rate_limit_callback` keeps the same name/signature for the
 # before_model_callback wiring in agent.py.
 rate_limit_callback = build_rate_limit_callback(config)
+
+
+# --- understand_trends research cache ---
+# The daily Google Trends table refreshes once a day, so every run on a given
+# (UTC) day researches the same ~25 terms. The searcher's raw findings are cached
+# in GCS keyed on (model, normalized term list, UTC date); a hit answers the
+# searcher's first model call directly, skipping its google_search + LLM turns.
+# The synthesizer and picker still run per run (their inputs differ by campaign).
+# The date in the key means a read never sees another day's findings (24h at
+# most). Expiry: each object is written with `custom_time` set to its write time,
+# and deployment/gcs_lifecycle.json deletes objects under this prefix one day
+# after that time, so yesterday's entries don't pile up in the bucket.
+RESEARCH_CACHE_PREFIX = "cache/understand"
+
+# Cache failures (GCS/API errors, dropped connections) are logged and fall
+# through to the live model call; anything else is a bug and should surface.
+_RESEARCH_CACHE_ERRORS = (api_exceptions.GoogleAPIError, ConnectionError, TimeoutError)
+
+
+def _research_cache_blob_name(state: State | dict[str, Any]) -> str | None:
+    """Return the GCS object name caching this run's raw research, or None.
+
+    The searcher researches the human-picked `target_search_trends` when present,
+    else the gathered `raw_gtrends` — the key follows the same choice so a
+    human-picked subset never reads the full-list findings (or vice versa).
+    """
+    picked = (state.get("target_search_trends") or {}).get("target_search_trends")
+    terms = picked or state.get("raw_gtrends") or []
+    normalized = sorted({str(t).strip().lower() for t in terms if str(t).strip()})
+    if not normalized:
+        return None
+    # The key deliberately omits the campaign: the searcher's temperature-1.5
+    # choice of what to look up for these terms is frozen by the first run of the
+    # day, and every later campaign with the same term list reuses those findings
+    # (only the synthesizer and picker vary per campaign).
+    day = datetime.datetime.now(datetime.UTC).strftime("%Y%m%d")
+    digest = hashlib.sha256(
+        "\n".join([config.worker_model, *normalized, day]).encode("utf-8")
+    ).hexdigest()
+    return f"{RESEARCH_CACHE_PREFIX}/{digest}.md"
+
+
+def _final_text(llm_response: LlmResponse) -> str:
+    """Text of a complete, tool-call-free model turn ("" for anything else).
+
+    Only a turn that finished with STOP counts: a MAX_TOKENS, SAFETY or RECITATION
+    turn can still carry (truncated or partial) text, and caching it would hand
+    every retry of the day the same bad findings.
+    """
+    if llm_response is None or llm_response.partial or not llm_response.content:
+        return ""
+    if llm_response.finish_reason != types.FinishReason.STOP:
+        return ""
+    parts = llm_response.content.parts or []
+    if any(getattr(p, "function_call", None) for p in parts):
+        return ""
+    return "".join(p.text for p in parts if p.text and not p.thought)
+
+
+async def load_cached_research(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> LlmResponse | None:
+    """`before_model_callback`: answer the searcher from today's research cache.
+
+    Only the searcher's FIRST model call is checked (later calls carry
+    google_search results, i.e. the run already missed). Cache errors never fail
+    the run — they log and fall through to the live model call.
+    """
+    if any(p.function_response for c in llm_request.contents for p in (c.parts or [])):
+        return None
+    blob_name = _research_cache_blob_name(callback_context.state)
+    if blob_name is None:
+        return None
+
+    def _read() -> str | None:
+        # One round trip: a missing object is a miss, not an error.
+        blob = _get_gcs_client().bucket(config.GCS_BUCKET_NAME).blob(blob_name)
+        try:
+            return blob.download_as_text()
+        except api_exceptions.NotFound:
+            return None
+
+    try:
+        cached = await asyncio.to_thread(_read)
+    except _RESEARCH_CACHE_ERRORS as e:
+        logger.warning("research cache read failed for %s: %s", blob_name, e)
+        return None
+    if not cached:
+        return None
+    logger.info("research cache hit: %s", blob_name)
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=cached)])
+    )
+
+
+async def store_cached_research(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> None:
+    """`after_model_callback`: cache the searcher's final raw findings.
+
+    Empty turns (the producer-empty landmine) and turns that did not finish with
+    STOP are never cached, so a retry still reaches the live model.
+    """
+    text = _final_text(llm_response)
+    blob_name = _research_cache_blob_name(callback_context.state)
+    if not text.strip() or blob_name is None:
+        return
+
+    def _write() -> None:
+        blob = _get_gcs_client().bucket(config.GCS_BUCKET_NAME).blob(blob_name)
+        # Drives the daysSinceCustomTime lifecycle rule (24h TTL).
+        blob.custom_time = datetime.datetime.now(datetime.UTC)
+        blob.upload_from_string(text, content_type="text/markdown")
+
+    try:
+        await asyncio.to_thread(_write)
+    except _RESEARCH_CACHE_ERRORS as e:
+        logger.warning("research cache write failed for %s: %s", blob_name, e)
@@ -8,7 +8,7 @@ def review_trends(tool_context: ToolContext) -> None:
     Opt-in checkpoint (gated by the `interactive_trend_pick` session flag). It
     pauses the run after `gather_trends_agent` has populated `state["raw_gtrends"]`
     (~25 Google Search terms) so the user can choose the subset to keep instead of
-    letting `pick_trends_agent` auto-pick 3.
+    letting `research_and_pick_trends_agent` auto-pick 3.
 
     When the run resumes, this tool call receives a function response of the shape:
         {
@@ -16,9 +16,10 @@ def review_trends(tool_context: ToolContext) -> None:
             "selected_trends": list[str],  # the terms the user chose to keep
             "instruction": str,          # tells you to continue the workflow
         }
-    Read the `instruction` field and continue: for each term in `selected_trends`,
-    call `save_search_trends_to_session_state(term)`, then call `write_trends_to_bq`.
-    Do NOT call `pick_trends_agent` in this branch.
+    Read the `instruction` field and continue: call
+    `save_all_search_trends(selected_trends)` once, then call
+    `research_and_pick_trends_agent` once (it researches only the chosen trends and
+    keeps them as the picks), then save the results with `finalize_outputs`.
     """
     tool_context.actions.skip_summarization = True
     return None
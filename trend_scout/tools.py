@@ -1,38 +1,41 @@
-import os
 import logging
 import datetime
-import warnings
 import json
-import tempfile
+import time
+import asyncio
+import functools
+import gzip
 import uuid
-from pathlib import Path
 from google.cloud import storage
 from google.cloud import bigquery
 from google.adk.tools import ToolContext
 
-from agent_common import collect_degradation_warnings
+from agent_common import (
+    collect_degradation_warnings,
+    get_bigquery_client,
+    get_gcs_client,
+)
 
 from .config import config
 
 
-# --- config ---
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-warnings.filterwarnings("ignore")
+# Configured once by the entry point (trend_scout/agent.py).
+logger = logging.getLogger(__name__)
 
 
 # ==============================
 # clients
 # =============================
+# One process-wide client per project (agent_common.clients), shared with the
+# research-cache callbacks and creative_agent when loaded in the same process.
 def _get_gcs_client() -> storage.Client:
-    """Get a configured GCS client."""
-    return storage.Client(project=config.PROJECT_ID)
+    """Get the configured GCS client (process-cached)."""
+    return get_gcs_client(config.PROJECT_ID)
 
 
 def _get_bigquery_client() -> bigquery.Client:
-    """Get a configured BigQuery client."""
-    return bigquery.Client(project=config.BQ_PROJECT_ID)
+    """Get the configured BigQuery client (process-cached)."""
+    return get_bigquery_client(config.BQ_PROJECT_ID)
 
 
 # =============================
@@ -50,8 +53,7 @@ def memorize(key: str, value: str, tool_context: ToolContext):
     Returns:
         A status message.
     """
-    mem_dict = tool_context.state
-    mem_dict[key] = value
+    tool_context.state[key] = value
     return {"status": f'Stored "{key}": "{value}"'}
 
 
@@ -79,22 +81,84 @@ def record_research_gaps(tool_context: ToolContext) -> dict:
 # ==============================
 # Google Search Trends (context)
 # =============================
-def _get_gtrends_max_date() -> str:
-    query = """
-        SELECT 
-         MAX(refresh_date) as max_date
+# Latest refresh_date of the public top_terms table. refresh_date is its
+# partitioning column, so the newest non-empty partition is read from table
+# metadata instead of scanning the column with MAX(refresh_date).
+_GTRENDS_MAX_DATE_SQL = """
+          SELECT PARSE_DATE('%Y%m%d', MAX(partition_id)) AS max_date
+          FROM `bigquery-public-data.google_trends.INFORMATION_SCHEMA.PARTITIONS`
+          WHERE table_name = 'top_terms'
+            AND partition_id NOT IN ('__NULL__', '__UNPARTITIONED__')
+            AND total_rows > 0
+"""
+
+# One job for both steps: a script resolves the latest refresh_date into a
+# variable, then selects that day's terms. The separate MAX() job (and its
+# DataFrame) used to add a full job round-trip; a script variable (unlike a
+# scalar subquery in WHERE) still lets BigQuery prune to one partition.
+# LIMIT 25 enforces the documented 25-row contract: terms from the refresh's
+# older weeks would otherwise lengthen the table handed to the model.
+_GTRENDS_TOP_TERMS_SQL = f"""
+        DECLARE max_date DATE DEFAULT ({_GTRENDS_MAX_DATE_SQL});
+        SELECT
+          term,
+          refresh_date,
+          ARRAY_AGG(STRUCT(rank,week) ORDER BY week DESC LIMIT 1) x
         FROM `bigquery-public-data.google_trends.top_terms`
-    """
+        WHERE refresh_date = max_date
+        GROUP BY term, refresh_date
+        ORDER BY (SELECT rank FROM UNNEST(x))
+        LIMIT 25
+"""
+
+# Upper bound on bytes billed for the trends reads (a metadata lookup and one
+# day's partition, normally a few MB): a schema or partitioning change upstream
+# fails the job instead of silently scanning the whole table. Static, so the
+# job config is built once at import and reused by every trends read.
+_GTRENDS_MAX_BYTES_BILLED = 10**9
+_GTRENDS_JOB_CONFIG = bigquery.QueryJobConfig(
+    maximum_bytes_billed=_GTRENDS_MAX_BYTES_BILLED
+)
+
+
+def _get_gtrends_max_date() -> str:
+    """Latest top_terms refresh date ('MM/DD/YYYY'), cached per UTC hour."""
+    now = datetime.datetime.now(datetime.UTC)
+    return _gtrends_max_date_for_hour(now.replace(minute=0, second=0, microsecond=0))
+
+
+# The public table refreshes at most daily, but at no fixed time: keyed on the
+# UTC day, a lookup made before that day's partition landed would pin the stale
+# date until midnight. Keying on the UTC hour bounds that staleness to an hour
+# while repeat calls in a process still skip the job; maxsize=1 drops the old key.
+@functools.lru_cache(maxsize=1)
+def _gtrends_max_date_for_hour(hour: datetime.datetime) -> str:
     bq_client = _get_bigquery_client()
-    max_date_df = bq_client.query(query).to_dataframe()
-    return max_date_df.max_date.iloc[0].strftime("%m/%d/%Y")
+    # One scalar: read it off the row iterator rather than building a DataFrame
+    # (and possibly a BigQuery Storage read session) for a single cell.
+    # query_and_wait returns the rows from the jobs.query call itself, without
+    # a separate job-status poll and getQueryResults fetch.
+    rows = bq_client.query_and_wait(
+        _GTRENDS_MAX_DATE_SQL, job_config=_GTRENDS_JOB_CONFIG
+    )
+    max_date = next(iter(rows))["max_date"]
+    return max_date.strftime("%m/%d/%Y")
 
 
-# max_date = _get_gtrends_max_date()
+def _format_trends_markdown(rows: list[tuple[str, int, str]]) -> str:
+    """Render `(term, rank, refresh_date)` rows as a markdown table (pure).
+
+    A hand-rolled join: for a fixed ~25-row, 3-column table this avoids
+    `DataFrame.to_markdown`'s lazy `tabulate` import and its column-sizing passes.
+    Pipes inside a term are escaped so they can't split a cell.
+    """
+    lines = ["| term | rank | refresh_date |", "|---|---|---|"]
+    for term, rank, refresh_date in rows:
+        cell = str(term).replace("|", "\\|")
+        lines.append(f"| {cell} | {rank} | {refresh_date} |")
+    return "\n".join(lines)
 
 
-# today_date: str = max_date
-# today_date: Today's date in the format 'MM/DD/YYYY'. Use the default value provided.
 def get_daily_gtrends(tool_context: ToolContext) -> str:
     """
     Retrieves the top 25 Google Search Trends (term, rank, refresh_date).
@@ -108,53 +172,85 @@ def get_daily_gtrends(tool_context: ToolContext) -> str:
              The table includes columns for 'term', 'rank', and 'refresh_date'.
              Returns 25 rows of results.
     """
-
-    # get latest refresh date
-    max_date = _get_gtrends_max_date()
-    logging.info(f"\n\nmax_date in trends_assistant: {max_date}\n\n")
-
-    query = f"""
-        SELECT
-          term,
-          refresh_date,
-          ARRAY_AGG(STRUCT(rank,week) ORDER BY week DESC LIMIT 1) x
-        FROM `bigquery-public-data.google_trends.top_terms`
-        WHERE refresh_date = PARSE_DATE('%m/%d/%Y',  '{max_date}')
-        GROUP BY term, refresh_date
-        ORDER BY (SELECT rank FROM UNNEST(x))
-        """
     try:
         bq_client = _get_bigquery_client()
 
-        # Setup the query for BigQuery
-        query_job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("parameter1", "STRING", max_date)
-            ]
+        # Execute the BigQuery script; the job's result is its final SELECT.
+        # ~25 rows: iterate them directly rather than building a DataFrame.
+        results = list(
+            bq_client.query_and_wait(
+                _GTRENDS_TOP_TERMS_SQL, job_config=_GTRENDS_JOB_CONFIG
+            )
         )
-        # Execute the BigQuery Query and retrieve results to local dataframe
-        results = bq_client.query(query, job_config=query_job_config).to_dataframe()
 
-        # Prepare dataframe
-        results.index += 1
-        results["rank"] = results.index
-        results = results.drop("x", axis=1)
-        new_order = ["term", "rank", "refresh_date"]
-        results = results[new_order]
+        # Rows are already ordered by rank; rank is the 1-based position.
+        terms = [r["term"] for r in results]
+        rows = [
+            (r["term"], rank, r["refresh_date"])
+            for rank, r in enumerate(results, start=1)
+        ]
+        if results:
+            # write_trends_to_bq records this date; saves it a second MAX() job.
+            max_date = results[0]["refresh_date"].strftime("%m/%d/%Y")
+            tool_context.state["gtrends_max_date"] = max_date
+            logger.info("max_date in trends_assistant: %s", max_date)
 
         # Update state
-        tool_context.state["raw_gtrends"] = results["term"].to_list()
-
-        # Convert the dataframe to Markdown
-        results = results.to_markdown(index=True)
+        tool_context.state["raw_gtrends"] = terms
 
-        return results
+        return _format_trends_markdown(rows)
     except Exception as e:
         # Let transient failures propagate so ADK 2.0 RetryConfig can retry.
-        logging.exception(f"Failed to gather daily trends: {e}")
+        logger.exception("Failed to gather daily trends: %s", e)
         raise
 
 
+# Object names of the run's persisted artifacts, under `<gcs_folder>/`.
+_SELECTED_TRENDS_FILENAME = "selected_trends.txt"
+_SESSION_STATE_FILENAME = "trawler_session_state.json"
+
+
+def _run_artifact_uri(gcs_folder: str, filename: str) -> str:
+    """The gs:// URI of a run artifact (no I/O)."""
+    return f"gs://{config.GCS_BUCKET_NAME}/{gcs_folder}/{filename}"
+
+
+def _upload_run_artifact(
+    gcs_folder: str,
+    filename: str,
+    data: str | bytes,
+    content_type: str,
+    content_encoding: str | None = None,
+) -> str:
+    """Upload in-memory `data` to `<gcs_folder>/<filename>`; return its gs:// URI.
+
+    The one GCS write path behind write_to_file and save_session_state_to_gcs.
+    Uploading from memory leaves no local scratch file to write, re-read, and
+    clean up (which also keeps concurrent runs sharing this process's CWD from
+    colliding on a scratch path — issue #104).
+
+    Logs the payload size and upload latency per artifact, so chunking or
+    compression choices can be tuned from real runs.
+    """
+    blob = (
+        _get_gcs_client()
+        .bucket(config.GCS_BUCKET_NAME)
+        .blob(f"{gcs_folder}/{filename}")
+    )
+    if content_encoding:
+        blob.content_encoding = content_encoding
+    start = time.perf_counter()
+    blob.upload_from_string(data, content_type=content_type)
+    logger.info(
+        "Uploaded %s: %d bytes (%s) in %.0f ms",
+        filename,
+        len(data) if isinstance(data, bytes) else len(data.encode("utf-8")),
+        content_encoding or "identity",
+        (time.perf_counter() - start) * 1000,
+    )
+    return _run_artifact_uri(gcs_folder, filename)
+
+
 def write_to_file(content: str, tool_context: ToolContext) -> dict:
     """
     Writes the given content to a markdown file. Saves the file to Google Cloud Storage.
@@ -167,27 +263,12 @@ def write_to_file(content: str, tool_context: ToolContext) -> dict:
         dict: A dictionary containing the status and the markdown file's Cloud Storage URI (gcs_uri).
     """
 
-    gcs_folder = tool_context.state["gcs_folder"]
-    artifact_key = "selected_trends.txt"
-
-    storage_client = _get_gcs_client()
-    gcs_bucket = config.GCS_BUCKET_NAME
-    bucket = storage_client.bucket(gcs_bucket)
-
-    # Per-invocation temp dir: concurrent runs share this process's CWD, so a
-    # fixed scratch dir (state["agent_output_dir"] == "trawler_output") + fixed
-    # filename collided (issue #104) — one run's rmtree raced another's write.
-    # A TemporaryDirectory is unique per call and auto-removed on context exit.
-    # The GCS object key uses the file BASENAME so the temp path never leaks in.
-    with tempfile.TemporaryDirectory() as td:
-        local_file = os.path.join(td, artifact_key)
-        Path(local_file).write_text(content)
-
-        gcs_blob_name = f"{gcs_folder}/{artifact_key}"
-        blob = bucket.blob(gcs_blob_name)
-        blob.upload_from_filename(local_file)
-
-    gcs_uri = f"gs://{gcs_bucket}/{gcs_blob_name}"
+    gcs_uri = _upload_run_artifact(
+        tool_context.state["gcs_folder"],
+        _SELECTED_TRENDS_FILENAME,
+        content,
+        content_type="text/markdown",
+    )
     tool_context.state["select_trends_markdown_gcs_uri"] = gcs_uri
 
     # Return a dictionary indicating success, and the artifact_key that was written.
@@ -197,28 +278,37 @@ def write_to_file(content: str, tool_context: ToolContext) -> dict:
     }
 
 
-def save_search_trends_to_session_state(
-    trend_term: str, tool_context: ToolContext
-) -> dict:
+def _trend_key(term: str) -> str:
+    """Normalized identity of a trend term for de-duplication."""
+    return term.strip().lower()
+
+
+def save_all_search_trends(trend_terms: list[str], tool_context: ToolContext) -> dict:
     """
-    Tool to save `trend_term` to the 'target_search_trends' state key.
-    Use this tool once the subset of trends have been selected.
+    Tool to save ALL selected trending search terms to the 'target_search_trends'
+    state key in a single call.
+    Use this tool once the subset of trends have been selected, passing every
+    selected term at once (one call per term would cost an orchestrator turn + a
+    session-state write each).
 
     Args:
-        trend_term (str): the selected trending search term.
+        trend_terms (list[str]): the selected trending search terms.
         tool_context: The tool context.
 
     Returns:
-        A status message.
+        A status message and the number of saved terms.
     """
-    existing_target_search_trends = tool_context.state.get(
-        "target_search_trends", {"target_search_trends": []}
-    )
-
-    existing_target_search_trends["target_search_trends"].append(trend_term)
-
-    tool_context.state["target_search_trends"] = existing_target_search_trends
-    return {"status": "ok"}
+    # Case/whitespace-insensitive dedupe, keeping the first spelling: a repeated
+    # term would otherwise bloat the persisted state and become a duplicate
+    # BigQuery row downstream.
+    seen: set[str] = set()
+    unique_terms = []
+    for term in trend_terms:
+        if _trend_key(term) not in seen:
+            seen.add(_trend_key(term))
+            unique_terms.append(term)
+    tool_context.state["target_search_trends"] = {"target_search_trends": unique_terms}
+    return {"status": "ok", "count": len(unique_terms)}
 
 
 def save_session_state_to_gcs(tool_context: ToolContext) -> dict:
@@ -233,25 +323,23 @@ def save_session_state_to_gcs(tool_context: ToolContext) -> dict:
     """
 
     session_state = tool_context.state.to_dict()
-    gcs_folder = session_state["gcs_folder"]
-    filename = "trawler_session_state.json"
 
-    storage_client = _get_gcs_client()
-    gcs_bucket = config.GCS_BUCKET_NAME
-    bucket = storage_client.bucket(gcs_bucket)
-
-    # Per-invocation temp dir (see write_to_file): isolates concurrent runs that
-    # share this process's CWD; the GCS object key uses the file BASENAME.
-    with tempfile.TemporaryDirectory() as td:
-        local_file = os.path.join(td, filename)
-        with open(local_file, "w") as f:
-            json.dump(session_state, f, indent=4)
-
-        gcs_blob_name = f"{gcs_folder}/{filename}"
-        blob = bucket.blob(gcs_blob_name)
-        blob.upload_from_filename(local_file)
-
-    gcs_uri = f"gs://{gcs_bucket}/{gcs_blob_name}"
+    # Compact one-shot dumps: `json.dump(..., indent=4)` always runs the stdlib's
+    # pure-Python encoder, while `dumps` without indent uses the C encoder — a
+    # several-fold speedup (and a smaller object) on the research-heavy state.
+    payload = json.dumps(session_state)
+
+    # Stored gzip-encoded: the research-heavy JSON compresses several-fold, and
+    # GCS transparently decompresses it for readers that don't accept gzip.
+    # Level 1, not gzip's default 9: repetitive JSON keeps most of the size win
+    # at a fraction of the CPU.
+    gcs_uri = _upload_run_artifact(
+        session_state["gcs_folder"],
+        _SESSION_STATE_FILENAME,
+        gzip.compress(payload.encode("utf-8"), compresslevel=1),
+        content_type="application/json",
+        content_encoding="gzip",
+    )
 
     # Return a dictionary indicating status and the Cloud Storage URI.
     return {
@@ -264,7 +352,7 @@ def _build_trend_insert_sql(
     *,
     table: str,
     unique_id: str,
-    trend: str,
+    trends: list[str],
     max_date: str,
     current_date: str,
     trawler_gcs: str,
@@ -273,14 +361,16 @@ def _build_trend_insert_sql(
     target_product: str,
     key_selling_points: str,
     research_gaps: str,
-) -> tuple[str, list[bigquery.ScalarQueryParameter]]:
-    """Build the single-row INSERT for `target_trends_crf` (pure, unit-testable).
+) -> tuple[str, list[bigquery.ScalarQueryParameter | bigquery.ArrayQueryParameter]]:
+    """Build the multi-row INSERT for `target_trends_crf` (pure, unit-testable).
 
-    Returns the parameterized SQL plus its bound query parameters. Values are
-    passed as `@named` BigQuery query parameters (never string-interpolated) so a
-    trend/brand/field containing a quote or apostrophe can't break the statement
-    or inject SQL. Only `table` is interpolated — it is a config-derived identifier
-    (BigQuery cannot parameterize table names), not user input.
+    Returns the parameterized SQL plus its bound query parameters. One statement
+    inserts a row per entry in `trends` via `UNNEST(@trends)`, so a run with N
+    selected trends costs one DML job instead of N. Values are passed as `@named`
+    BigQuery query parameters (never string-interpolated) so a trend/brand/field
+    containing a quote or apostrophe can't break the statement or inject SQL.
+    Only `table` is interpolated — it is a config-derived identifier (BigQuery
+    cannot parameterize table names), not user input.
 
     `research_gaps` mirrors `creative_evals.research_gaps`: an empty string on a
     clean run, or the `collect_degradation_warnings` note(s) when the resilient
@@ -301,10 +391,9 @@ def _build_trend_insert_sql(
         target_product,
         key_selling_point,
         research_gaps)
-    VALUES
-    (
+    SELECT
         @unique_id,
-        @trend,
+        trend,
         PARSE_DATE('%m/%d/%Y', @max_date),
         PARSE_DATE('%m/%d/%Y', @current_date),
         CURRENT_TIMESTAMP(),
@@ -314,11 +403,11 @@ def _build_trend_insert_sql(
         @target_product,
         @key_selling_points,
         @research_gaps
-    );
+    FROM UNNEST(@trends) AS trend;
     """
     params = [
         bigquery.ScalarQueryParameter("unique_id", "STRING", unique_id),
-        bigquery.ScalarQueryParameter("trend", "STRING", trend),
+        bigquery.ArrayQueryParameter("trends", "STRING", list(trends)),
         bigquery.ScalarQueryParameter("max_date", "STRING", max_date),
         bigquery.ScalarQueryParameter("current_date", "STRING", current_date),
         bigquery.ScalarQueryParameter("trawler_gcs", "STRING", trawler_gcs),
@@ -349,9 +438,9 @@ def write_trends_to_bq(tool_context: ToolContext) -> dict:
     """
     bq_client = _get_bigquery_client()
 
-    # get latest refresh date
-    max_date = _get_gtrends_max_date()
-    logging.info(f"\n\nmax_date in trends_assistant: {max_date}\n\n")
+    # latest refresh date: recorded by get_daily_gtrends, else looked up
+    max_date = tool_context.state.get("gtrends_max_date") or _get_gtrends_max_date()
+    logger.info("\n\nmax_date in trends_assistant: %s\n\n", max_date)
 
     # values to insert
     unique_id = f"{str(uuid.uuid4())[:8]}"
@@ -369,43 +458,93 @@ def write_trends_to_bq(tool_context: ToolContext) -> dict:
     table = f"{config.BQ_PROJECT_ID}.{config.BQ_DATASET_ID}.{config.BQ_TABLE_TARGETS}"
 
     try:
-        # insert a row for each selected target search trend
+        # insert every selected target search trend in ONE DML job (one
+        # round-trip + one job-slot wait, not one per trend)
         target_trends = tool_context.state.get("target_search_trends")
-        for trend in target_trends["target_search_trends"]:
-            # write SQL (parameterized — see _build_trend_insert_sql)
-            sql_query, query_params = _build_trend_insert_sql(
-                table=table,
-                unique_id=unique_id,
-                trend=trend,
-                max_date=max_date,
-                current_date=current_date,
-                trawler_gcs=trawler_gcs,
-                brand=tool_context.state["brand"],
-                target_audience=tool_context.state["target_audience"],
-                target_product=tool_context.state["target_product"],
-                key_selling_points=tool_context.state["key_selling_points"],
-                research_gaps=research_gaps,
-            )
-            # make API request
-            job = bq_client.query(
-                sql_query,
-                job_config=bigquery.QueryJobConfig(query_parameters=query_params),
-            )
-            job.result()  # wait for job to complete
-            if job.errors:
-                logging.error(
-                    f"DML INSERT job for trend: '{trend}' failed: {job.errors}"
-                )
-                raise RuntimeError(f"BigQuery insert returned errors: {job.errors}")
-            else:
-                logging.info(
-                    f"DML INSERT job {job.job_id} for trend: `{trend}` completed; added {job.num_dml_affected_rows} rows."
-                )
+        trends = target_trends["target_search_trends"]
+        # write SQL (parameterized — see _build_trend_insert_sql)
+        sql_query, query_params = _build_trend_insert_sql(
+            table=table,
+            unique_id=unique_id,
+            trends=trends,
+            max_date=max_date,
+            current_date=current_date,
+            trawler_gcs=trawler_gcs,
+            brand=tool_context.state["brand"],
+            target_audience=tool_context.state["target_audience"],
+            target_product=tool_context.state["target_product"],
+            key_selling_points=tool_context.state["key_selling_points"],
+            research_gaps=research_gaps,
+        )
+        # make API request
+        job = bq_client.query(
+            sql_query,
+            job_config=bigquery.QueryJobConfig(query_parameters=query_params),
+        )
+        job.result()  # wait for job to complete
+        if job.errors:
+            logger.error("DML INSERT job for trends: %s failed: %s", trends, job.errors)
+            raise RuntimeError(f"BigQuery insert returned errors: {job.errors}")
+        logger.info(
+            "DML INSERT job %s for %d trends completed; added %s rows.",
+            job.job_id,
+            len(trends),
+            job.num_dml_affected_rows,
+        )
         return {
             "status": "success",
             "trends": ", ".join(target_trends["target_search_trends"]),
         }
     except Exception as e:
         # Let transient failures propagate so ADK 2.0 RetryConfig can retry.
-        logging.exception(f"Failed to insert rows to bq: {e}")
+        logger.exception("Failed to insert rows to bq: %s", e)
         raise
+
+
+async def finalize_outputs(tool_context: ToolContext) -> dict:
+    """
+    Persists the run's outputs in ONE call: writes the selected trends to BigQuery,
+    saves the 'selected_gtrends' markdown to Cloud Storage, and saves the session
+    state JSON to Cloud Storage. The three writes are independent, so they run
+    concurrently (total latency is the slowest write, not the sum of all three).
+
+    Args:
+        tool_context (ToolContext): The tool context.
+
+    Returns:
+        dict: A dictionary with an overall 'status' ('success' or 'error') and one
+              entry per write. On 'error', 'failed' names the writes to retry
+              individually (the writes that succeeded must not be repeated).
+    """
+    # The session-state snapshot runs alongside write_to_file, so record the
+    # (deterministic) markdown URI up front to keep it in the snapshot.
+    tool_context.state["select_trends_markdown_gcs_uri"] = _run_artifact_uri(
+        tool_context.state["gcs_folder"], _SELECTED_TRENDS_FILENAME
+    )
+
+    steps = {
+        "write_trends_to_bq": asyncio.to_thread(write_trends_to_bq, tool_context),
+        "write_to_file": asyncio.to_thread(
+            write_to_file, tool_context.state.get("selected_gtrends", ""), tool_context
+        ),
+        "save_session_state_to_gcs": asyncio.to_thread(
+            save_session_state_to_gcs, tool_context
+        ),
+    }
+    results = dict(
+        zip(steps, await asyncio.gather(*steps.values(), return_exceptions=True))
+    )
+
+    failed = [name for name, r in results.items() if isinstance(r, BaseException)]
+    if len(failed) == len(results):
+        # Nothing landed, so a whole-call retry is safe: let ADK RetryConfig retry.
+        raise results[failed[0]]
+    for name in failed:
+        logger.error("finalize_outputs: %s failed: %r", name, results[name])
+        results[name] = {"status": "error", "error_message": str(results[name])}
+
+    return {
+        "status": "error" if failed else "success",
+        "failed": failed,
+        **results,
+    }